@@ -1,6 +1,5 @@
 # src/agent/chat_streaming_agent.py
 
-import os
 import json5
 import yaml
 import asyncio
@@ -20,6 +19,8 @@ from src.data_models.chat_completions import (
 from src.llm import LLMFactory
 from src.tools import ToolRegistry
 from src.prompt_builders import PromptPayload, PromptBuilderOutput, BasePromptBuilder
+from src.utils.settings import get_settings
+from src.utils.yaml_loader import YamlSafeLoader
 from src.utils.factory import PromptBuilderFactory, ToolCallParserFactory, FormatType
 from src.llm.tool_detection.detection_result import DetectionState, DetectionResult
 from src.llm.tool_detection import ManualToolCallDetectionStrategy, VendorToolCallDetectionStrategy
@@ -63,6 +64,8 @@ class StreamingChatAgent:
             - `history_limit` (int): Maximum number of historical messages to consider
             - `system_prompt` (str): System prompt to prepend to conversations
             - `detection_mode` (str): Mode for tool detection ('vendor' or 'manual')
+            - `pattern_detection_backend` (str): Pattern matcher for manual detection
+              ('aho-corasick' or 'hyperscan')
             - `use_vendor_chat_completions` (bool): Whether to use vendor chat completions
             - `models_config` (Dict): Configuration for language models
             - `tools_config` (Dict): Configuration for available tools
@@ -85,7 +88,7 @@ class StreamingChatAgent:
 
         # Initialize logger
         self.logger = logging.getLogger(self.__class__.__name__)
-        logging_level = os.getenv("LOG_LEVEL", "INFO")
+        logging_level = get_settings().log_level
         logging.basicConfig(level=getattr(logging, logging_level.upper(), None))
         self.logger.info(f'Logger set to {logging_level}')
 
@@ -105,13 +108,14 @@ class StreamingChatAgent:
                          "\n" + "=" * 60 + "\n")
         if self.detection_mode == "manual":
             with open("src/configs/parsing.yaml", "r") as f:
-                parser_config = yaml.safe_load(f)
+                parser_config = yaml.load(f, Loader=YamlSafeLoader)
             self.tool_call_parser = ToolCallParserFactory.get_parser(
                 FormatType.JSON,
                 parser_config
             )
             self.detection_strategy = ManualToolCallDetectionStrategy(
-                parser=self.tool_call_parser
+                parser=self.tool_call_parser,
+                pattern_backend=self.config.get("pattern_detection_backend", "aho-corasick")
             )
         else:
             self.detection_strategy = VendorToolCallDetectionStrategy()
@@ -129,6 +133,10 @@ class StreamingChatAgent:
         )
         asyncio.create_task(self.tool_registry.initialize_all_tools())
 
+    async def close(self) -> None:
+        """Release resources held by the agent's tools, e.g. on application shutdown."""
+        await self.tool_registry.close()
+
     @handle_streaming_errors
     async def stream_step(
             self,
@@ -223,7 +231,7 @@ class StreamingChatAgent:
         )
 
         prompt_output: PromptBuilderOutput = (
-            await self.prompt_builder.build_chat(prompt_payload) if self.use_vendor_chat_completions
+            self.prompt_builder.build_chat_sync(prompt_payload) if self.use_vendor_chat_completions
             else await self.prompt_builder.build_text(prompt_payload)
         )
         llm_input = prompt_output.get_output()
@@ -235,14 +243,16 @@ class StreamingChatAgent:
         }
         stream_kwargs = {k: v for k, v in stream_kwargs.items() if v is not None}
 
-        self.logger.debug(f"stream_kwargs: {stream_kwargs}")
+        self.logger.debug("stream_kwargs: %s", stream_kwargs)
         llm_adapter = context.llm_factory.get_adapter(self.response_model_name)
         stream_gen = llm_adapter.gen_sse_stream if isinstance(llm_input, str) else llm_adapter.gen_chat_sse_stream
 
         accumulated_content = []
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
         async for sse_chunk in stream_gen(**stream_kwargs):
             detection_result = await self.detection_strategy.detect_chunk(sse_chunk, context)
-            self.logger.debug(f"Detection result: {detection_result}")
+            if debug_enabled:
+                self.logger.debug("Detection result: %s", detection_result)
 
             if detection_result.state in [DetectionState.NO_MATCH, DetectionState.PARTIAL_MATCH]:
                 if detection_result.content:
@@ -255,7 +265,7 @@ class StreamingChatAgent:
                 return
 
         final_result = await self.detection_strategy.finalize_detection(context)
-        self.logger.debug(f"Final detection result: {final_result}")
+        self.logger.debug("Final detection result: %s", final_result)
 
         if final_result.state == DetectionState.COMPLETE_MATCH:
             async for chunk in self._handle_complete_match(context, final_result, accumulated_content):
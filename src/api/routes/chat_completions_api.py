@@ -11,7 +11,6 @@ The module provides:
 - Agent info endpoint (compatible with OpenAI's /models format)
 """
 
-import os
 import time
 import yaml
 import logging
@@ -23,6 +22,8 @@ from fastapi import APIRouter, Body, Depends, Header, HTTPException
 
 from src.agent import StreamingChatAgent
 from src.api.request_models import ChatCompletionRequest
+from src.utils.settings import get_settings
+from src.utils.yaml_loader import YamlSafeLoader
 from src.data_models.chat_completions import (
     TextChatMessage,
     UserMessage,
@@ -38,8 +39,8 @@ AGENT_START_TIME = int(time.time())
 # Security setup
 API_KEY_NAME = "X-API-KEY"
 api_key_header = APIKeyHeader(name=API_KEY_NAME, auto_error=False)
-FLEXO_API_KEY = os.getenv("FLEXO_API_KEY")
-ENABLE_API_KEY = os.getenv("ENABLE_API_KEY", "true").lower() != "false"
+FLEXO_API_KEY = get_settings().flexo_api_key
+ENABLE_API_KEY = get_settings().enable_api_key
 
 if not FLEXO_API_KEY:
     logger.error("FLEXO_API_KEY environment variable not set")
@@ -75,7 +76,7 @@ async def get_api_key(api_key: str = Depends(api_key_header)):
 try:
     logger.debug("Loading agent configuration from yaml")
     with open('src/configs/agent.yaml', 'r') as file:
-        config = yaml.safe_load(file)
+        config = yaml.load(file, Loader=YamlSafeLoader)
     streaming_chat_agent_instance = StreamingChatAgent(config=config)
     logger.info("StreamingChatAgent successfully initialized")
 except Exception as e:
@@ -9,6 +9,7 @@ from pymilvus import (
     drop_collection,
 )
 from .base_adapter import DatabaseAdapter
+from src.utils.yaml_loader import YamlSafeLoader
 
 
 class MilvusClient(DatabaseAdapter):
@@ -108,7 +109,7 @@ class MilvusClient(DatabaseAdapter):
     def _load_config(self, config_file):
         """Loads configuration settings from a YAML file."""
         with open(config_file, "r") as file:
-            self.config = yaml.safe_load(file)
+            self.config = yaml.load(file, Loader=YamlSafeLoader)
 
     def _connect(self, secure: bool = True):
         """Connects to the Milvus server using loaded configuration."""
@@ -1,2 +1,3 @@
 from .buffered_processor_standard import AhoCorasickBufferedProcessor
 from .buffered_processor_normalized import AhoCorasickBufferedProcessorNormalized
+from .buffered_processor_hyperscan import HyperscanBufferedProcessorNormalized, hyperscan_available
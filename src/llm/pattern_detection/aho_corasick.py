@@ -15,7 +15,7 @@ Example:
 """
 
 from collections import deque
-from typing import Dict, List, Tuple
+from typing import Any, Dict, List, Tuple
 
 
 class AhoCorasickAutomaton:
@@ -82,6 +82,41 @@ class AhoCorasickAutomaton:
                 self.fail[nxt_state] = f
                 self.output[nxt_state].extend(self.output[f])
 
+    def to_tables(self) -> Dict[str, Any]:
+        """Exports the automaton's patterns and transition tables.
+
+        The returned dictionary only contains JSON-serializable values and can be
+        passed to `from_tables` to rebuild the automaton without recompiling it.
+
+        Returns:
+            A dictionary with the `patterns`, `next_states`, `fail` and `output` tables.
+        """
+        return {
+            "patterns": self.patterns,
+            "next_states": self.next_states,
+            "fail": self.fail,
+            "output": self.output,
+        }
+
+    @classmethod
+    def from_tables(cls, tables: Dict[str, Any]) -> "AhoCorasickAutomaton":
+        """Rebuilds an automaton from tables produced by `to_tables`.
+
+        Args:
+            tables: A dictionary with the `patterns`, `next_states`, `fail` and
+                `output` tables of a previously built automaton.
+
+        Returns:
+            An `AhoCorasickAutomaton` in its initial state.
+        """
+        automaton = cls.__new__(cls)
+        automaton.patterns = tables["patterns"]
+        automaton.next_states = tables["next_states"]
+        automaton.fail = tables["fail"]
+        automaton.output = tables["output"]
+        automaton.current_state = 0
+        return automaton
+
     def _insert(self, pattern_str: str, pattern_name: str):
         """Inserts a pattern into the trie structure of the automaton.
 
@@ -38,6 +38,23 @@ class AhoCorasickAutomatonNormalized:
 
         self.automaton = AhoCorasickAutomaton(self.normalized_patterns)
 
+    @classmethod
+    def from_automaton(cls, automaton: AhoCorasickAutomaton) -> "AhoCorasickAutomatonNormalized":
+        """Wraps an automaton that was already built from normalized patterns.
+
+        Args:
+            automaton: An `AhoCorasickAutomaton` whose patterns are already normalized,
+                e.g. one loaded with `load_compiled_automaton`.
+
+        Returns:
+            An `AhoCorasickAutomatonNormalized` using the given automaton.
+        """
+        normalized = cls.__new__(cls)
+        normalized.normalized_patterns = dict(automaton.patterns)
+        normalized.pattern_lengths = {name: len(pat) for name, pat in automaton.patterns.items()}
+        normalized.automaton = automaton
+        return normalized
+
     def reset_state(self):
         """Resets the automaton to its initial state.
 
@@ -0,0 +1,127 @@
+# src/llm/pattern_detection/buffered_processor_hyperscan.py
+
+from typing import List, Optional, Tuple
+
+from src.data_models.streaming import PatternMatchResult
+from src.llm.pattern_detection.pattern_utils import load_patterns
+from src.llm.pattern_detection.pattern_utils import normalize_and_map
+from src.llm.pattern_detection.base_buffered_processor import BaseBufferedProcessor
+
+try:
+    import hyperscan
+except ImportError:  # pragma: no cover - optional dependency
+    hyperscan = None
+
+
+def hyperscan_available() -> bool:
+    """Returns True if the optional `hyperscan` package can be imported."""
+    return hyperscan is not None
+
+
+class HyperscanBufferedProcessorNormalized(BaseBufferedProcessor):
+    """A buffered processor that performs normalized pattern matching with Hyperscan.
+
+    Drop-in alternative to `AhoCorasickBufferedProcessorNormalized`. Patterns are
+    normalized (whitespace removed) and compiled once into a Hyperscan literal
+    database, which scans input with SIMD instructions instead of walking the
+    automaton one character at a time in Python.
+
+    Chunk boundaries are handled by the shared `BaseBufferedProcessor` trailing
+    buffer (the last `max_pattern_len - 1` characters are carried over), so block
+    mode scanning is sufficient and no Hyperscan stream state is needed.
+
+    Attributes:
+        pattern_names: Pattern names indexed by their Hyperscan expression id.
+        max_pattern_len: The length of the longest pattern in the normalized patterns.
+        tool_call_message: Message to include when a tool call is detected.
+
+    Args:
+        yaml_path: Path to the YAML file containing pattern definitions.
+        tool_call_message: Optional message to use when a tool call is detected.
+            Defaults to "Tool call detected."
+
+    Raises:
+        `ImportError`: If the optional `hyperscan` package is not installed.
+    """
+
+    def __init__(self, yaml_path: str, tool_call_message: str = "Tool call detected."):
+        if hyperscan is None:
+            raise ImportError(
+                "HyperscanBufferedProcessorNormalized requires the 'hyperscan' package. "
+                "Install it with `pip install hyperscan`."
+            )
+        super().__init__(tool_call_message)
+        raw_patterns = load_patterns(yaml_path)
+        self.pattern_names: List[str] = list(raw_patterns.keys())
+        normalized = [normalize_and_map(p)[0].encode("utf-8") for p in raw_patterns.values()]
+        self.max_pattern_len = max(len(normalize_and_map(p)[0]) for p in raw_patterns.values())
+
+        self.db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        self.db.compile(
+            expressions=normalized,
+            ids=list(range(len(normalized))),
+            elements=len(normalized),
+            flags=hyperscan.HS_FLAG_SOM_LEFTMOST,
+            literal=True,
+        )
+        self.scratch = hyperscan.Scratch(self.db)
+
+    @staticmethod
+    def _on_match(pattern_id: int, start: int, end: int, flags: int, matches: list) -> Optional[bool]:
+        """Hyperscan match callback collecting `(start, end, pattern_id)` byte offsets."""
+        matches.append((start, end, pattern_id))
+        return None
+
+    def _scan(self, norm_bytes: bytes) -> List[Tuple[int, int, int]]:
+        """Scans normalized bytes and returns all matches as `(start, end, pattern_id)`."""
+        matches: List[Tuple[int, int, int]] = []
+        self.db.scan(norm_bytes, match_event_handler=self._on_match, context=matches, scratch=self.scratch)
+        return matches
+
+    def process_chunk_impl(self, combined_original: str):
+        """Processes a chunk of text to find pattern matches while ignoring whitespace.
+
+        Behaves exactly like `AhoCorasickBufferedProcessorNormalized.process_chunk_impl`:
+        the earliest match (by end position, longest first on ties) wins and everything
+        before it is safe output.
+
+        Args:
+            `combined_original`: The original text chunk to process.
+
+        Returns:
+            A tuple containing:
+
+                - `PatternMatchResult`: Result object containing match information and
+                    processed text.
+                - `str`: Any trailing text that needs to be carried over to the next
+                    chunk.
+        """
+        result = PatternMatchResult()
+        norm_combined, index_map = normalize_and_map(combined_original)
+        norm_bytes = norm_combined.encode("utf-8")
+        matches = self._scan(norm_bytes)
+
+        if not matches:
+            keep_len = min(self.max_pattern_len - 1, len(norm_combined))
+            if keep_len > 0:
+                orig_keep_start = index_map[len(norm_combined) - keep_len]
+                safe_text = combined_original[:orig_keep_start]
+                new_trailing = combined_original[orig_keep_start:]
+            else:
+                safe_text = combined_original
+                new_trailing = ""
+            result.output = safe_text
+            return result, new_trailing
+
+        start, _, pattern_id = min(matches, key=lambda m: (m[1], m[0]))
+        if len(norm_bytes) != len(norm_combined):
+            # Non-ASCII input: convert the byte offset back into a character offset.
+            start = len(norm_bytes[:start].decode("utf-8"))
+
+        original_start = index_map[start]
+        result.matched = True
+        result.pattern_name = self.pattern_names[pattern_id]
+        result.tool_call_message = self.tool_call_message
+        result.output = combined_original[:original_start]
+        result.text_with_tool_call = combined_original[original_start:]
+        return result, ""
@@ -1,12 +1,31 @@
 # src/llm/pattern_detection/buffered_processor_normalized.py
 
+from functools import lru_cache
+from typing import Any, Dict
+
 from src.data_models.streaming import PatternMatchResult
 from src.llm.pattern_detection.pattern_utils import load_patterns
 from src.llm.pattern_detection.pattern_utils import normalize_and_map
+from src.llm.pattern_detection.aho_corasick import AhoCorasickAutomaton
 from src.llm.pattern_detection.base_buffered_processor import BaseBufferedProcessor
 from src.llm.pattern_detection.aho_corasick_normalized import AhoCorasickAutomatonNormalized
 
 
+@lru_cache(maxsize=4)
+def _load_automaton_tables(yaml_path: str) -> Dict[str, Any]:
+    """Builds (or loads the precompiled) normalized automaton tables once per pattern file.
+
+    The tables are only read during matching, so every processor for the same file
+    shares them and keeps just its own current state.
+    """
+    # Imported here so `python -m src.llm.pattern_detection.compile_patterns` runs cleanly
+    from src.llm.pattern_detection.compile_patterns import load_compiled_automaton
+    compiled = load_compiled_automaton(yaml_path)
+    if compiled is None:
+        compiled = AhoCorasickAutomatonNormalized(load_patterns(yaml_path)).automaton
+    return compiled.to_tables()
+
+
 class AhoCorasickBufferedProcessorNormalized(BaseBufferedProcessor):
     """A buffered processor that performs normalized pattern matching ignoring whitespace.
 
@@ -19,6 +38,12 @@ class AhoCorasickBufferedProcessorNormalized(BaseBufferedProcessor):
         max_pattern_len: The length of the longest pattern in the normalized patterns.
         tool_call_message: Message to include when a tool call is detected.
 
+    The automaton tables for a pattern file are built once per process and shared
+    by all processors; each processor only owns its matching state and buffer. If
+    an up-to-date compiled automaton produced by
+    `python -m src.llm.pattern_detection.compile_patterns` exists next to the YAML
+    file it is loaded instead of rebuilding the automaton from the patterns.
+
     Args:
         yaml_path: Path to the YAML file containing pattern definitions.
         tool_call_message: Optional message to use when a tool call is detected.
@@ -27,8 +52,8 @@ class AhoCorasickBufferedProcessorNormalized(BaseBufferedProcessor):
 
     def __init__(self, yaml_path: str, tool_call_message: str = "Tool call detected."):
         super().__init__(tool_call_message)
-        raw_patterns = load_patterns(yaml_path)
-        self.automaton = AhoCorasickAutomatonNormalized(raw_patterns)
+        shared = AhoCorasickAutomaton.from_tables(_load_automaton_tables(yaml_path))
+        self.automaton = AhoCorasickAutomatonNormalized.from_automaton(shared)
         self.max_pattern_len = max(len(p) for p in self.automaton.normalized_patterns.values())
         self.automaton.reset_state()
 
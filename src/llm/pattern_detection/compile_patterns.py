@@ -0,0 +1,103 @@
+# src/llm/pattern_detection/compile_patterns.py
+
+"""Precompiles tool call patterns into a serialized Aho-Corasick automaton.
+
+Building the normalized automaton means parsing the YAML pattern file and
+constructing the trie and failure links in Python, which every uvicorn worker
+would otherwise repeat at startup. This module runs that work once (e.g. while
+building the container image) and stores the resulting tables as JSON next to
+the YAML file. At startup the tables are loaded with the C JSON decoder instead.
+
+The compiled file records a SHA-256 digest of the YAML it was built from and is
+ignored if the YAML has changed since, so a stale file can never be used.
+
+Example:
+    python -m src.llm.pattern_detection.compile_patterns
+    python -m src.llm.pattern_detection.compile_patterns path/to/patterns.yaml
+"""
+
+import sys
+import json
+import hashlib
+import logging
+from pathlib import Path
+from typing import Optional
+
+from src.llm.pattern_detection.pattern_utils import load_patterns
+from src.llm.pattern_detection.aho_corasick import AhoCorasickAutomaton
+from src.llm.pattern_detection.aho_corasick_normalized import AhoCorasickAutomatonNormalized
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PATTERNS_PATH = "src/configs/tool_call_patterns.yaml"
+COMPILED_SUFFIX = ".compiled.json"
+
+
+def compiled_path_for(yaml_path: str) -> Path:
+    """Returns the path of the compiled automaton for a YAML pattern file.
+
+    Args:
+        yaml_path: Path to the YAML file containing pattern definitions.
+
+    Returns:
+        The YAML path with its suffix replaced by `.compiled.json`.
+    """
+    return Path(yaml_path).with_suffix(COMPILED_SUFFIX)
+
+
+def _file_digest(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def compile_patterns(yaml_path: str = DEFAULT_PATTERNS_PATH, output_path: Optional[str] = None) -> Path:
+    """Builds the normalized automaton for a pattern file and writes it as JSON.
+
+    Args:
+        yaml_path: Path to the YAML file containing pattern definitions.
+        output_path: Where to write the compiled automaton. Defaults to
+            `compiled_path_for(yaml_path)`.
+
+    Returns:
+        The path the compiled automaton was written to.
+    """
+    output = Path(output_path) if output_path else compiled_path_for(yaml_path)
+    normalized = AhoCorasickAutomatonNormalized(load_patterns(yaml_path))
+    payload = {
+        "source_sha256": _file_digest(yaml_path),
+        "automaton": normalized.automaton.to_tables(),
+    }
+    with open(output, "w") as f:
+        json.dump(payload, f, separators=(",", ":"))
+    return output
+
+
+def load_compiled_automaton(yaml_path: str) -> Optional[AhoCorasickAutomaton]:
+    """Loads the compiled automaton for a YAML pattern file if it is up to date.
+
+    Args:
+        yaml_path: Path to the YAML file containing pattern definitions.
+
+    Returns:
+        The precompiled `AhoCorasickAutomaton` over normalized patterns, or None if
+        no compiled file exists, it cannot be read, or it was built from a
+        different version of the YAML file.
+    """
+    compiled = compiled_path_for(yaml_path)
+    if not compiled.is_file():
+        return None
+    try:
+        with open(compiled, "r") as f:
+            payload = json.load(f)
+        if payload.get("source_sha256") != _file_digest(yaml_path):
+            logger.info("Compiled patterns at %s are stale; rebuilding from %s", compiled, yaml_path)
+            return None
+        return AhoCorasickAutomaton.from_tables(payload["automaton"])
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning("Ignoring unreadable compiled patterns at %s: %s", compiled, str(e))
+        return None
+
+
+if __name__ == "__main__":
+    source = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_PATTERNS_PATH
+    print(f"Compiled {source} -> {compile_patterns(source)}")
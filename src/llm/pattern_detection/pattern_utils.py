@@ -3,6 +3,8 @@
 import yaml
 from typing import Dict
 
+from src.utils.yaml_loader import YamlSafeLoader
+
 
 def load_patterns(yaml_path: str) -> Dict[str, str]:
     """
@@ -15,7 +17,7 @@ def load_patterns(yaml_path: str) -> Dict[str, str]:
         Dictionary mapping pattern names to pattern strings
     """
     with open(yaml_path, 'r') as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=YamlSafeLoader)
     return config.get('patterns', {})
 
 
@@ -1,8 +1,8 @@
 # src/llm/tool_detection/detection_result.py
 
 from enum import Enum
+from dataclasses import dataclass
 from typing import Optional, List
-from pydantic import BaseModel
 
 from src.api import SSEChunk
 from src.data_models.chat_completions import ToolCall
@@ -24,13 +24,18 @@ class DetectionState(str, Enum):
     COMPLETE_MATCH = "complete_match"
 
 
-class DetectionResult(BaseModel):
+@dataclass(slots=True)
+class DetectionResult:
     """Container for tool call detection results.
 
     Encapsulates the result of processing an SSE chunk for tool calls,
     including the detection state, any found tool calls, accumulated content,
     and the original chunk.
 
+    This is a plain slotted dataclass rather than a Pydantic model: one is
+    created for every streamed chunk and it never crosses an API boundary,
+    so field validation is not needed.
+
     Attributes:
         state (DetectionState): The current state of tool call detection.
             Indicates whether a tool call was found and if it's complete.
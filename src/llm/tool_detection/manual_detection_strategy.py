@@ -1,6 +1,9 @@
 # src/llm/tool_detection/manual_tool_call_detection.py
 
+import io
+import uuid
 import logging
+import itertools
 from typing import List
 
 from src.api import SSEChunk
@@ -8,7 +11,12 @@ from src.data_models.agent import StreamContext
 from src.tools.core.parsers import BaseToolCallParser
 from src.data_models.chat_completions import ToolCall, FunctionDetail
 from src.llm.tool_detection import BaseToolCallDetectionStrategy
-from src.llm.pattern_detection import AhoCorasickBufferedProcessorNormalized, AhoCorasickBufferedProcessor
+from src.llm.pattern_detection import (
+    AhoCorasickBufferedProcessorNormalized,
+    AhoCorasickBufferedProcessor,
+    HyperscanBufferedProcessorNormalized,
+    hyperscan_available,
+)
 from src.llm.tool_detection.detection_result import DetectionResult, DetectionState
 
 
@@ -23,12 +31,14 @@ class ManualToolCallDetectionStrategy(BaseToolCallDetectionStrategy):
         parser (BaseToolCallParser): Parser instance for processing detected tool calls.
         pattern_config_path (str, optional): Path to YAML config file containing tool call patterns.
             Defaults to "src/configs/tool_call_patterns.yaml".
+        pattern_backend (str, optional): Pattern matching backend, either "aho-corasick"
+            or "hyperscan". Falls back to "aho-corasick" when the optional `hyperscan`
+            package is not installed. Defaults to "aho-corasick".
 
     Attributes:
         tool_call_parser (BaseToolCallParser): Parser for processing tool calls.
-        pattern_detector (AhoCorasickBufferedProcessor): Pattern matching processor.
-        pre_tool_call_content (List[str]): Buffer for content before tool call.
-        tool_call_buffer (str): Buffer for accumulating tool call content.
+        pattern_detector (BaseBufferedProcessor): Pattern matching processor.
+        tool_call_buffer (io.StringIO): Buffer for accumulating tool call content.
         in_tool_call (bool): Flag indicating if currently processing a tool call.
         accumulation_mode (bool): Flag for content accumulation mode.
 
@@ -46,16 +56,45 @@ class ManualToolCallDetectionStrategy(BaseToolCallDetectionStrategy):
         ```
     """
 
-    def __init__(self, parser: BaseToolCallParser, pattern_config_path: str = "src/configs/tool_call_patterns.yaml"):
+    def __init__(
+            self,
+            parser: BaseToolCallParser,
+            pattern_config_path: str = "src/configs/tool_call_patterns.yaml",
+            pattern_backend: str = "aho-corasick"
+    ):
         self.logger = logging.getLogger(self.__class__.__name__)
         self.logger.debug("Initializing ManualToolCallDetectionStrategy with config: %s", pattern_config_path)
         self.tool_call_parser = parser
-        self.pattern_detector = AhoCorasickBufferedProcessorNormalized(pattern_config_path)
+        self.pattern_detector = self._create_pattern_detector(pattern_config_path, pattern_backend)
 
-        self.pre_tool_call_content: List[str] = []
-        self.tool_call_buffer: str = ""
+        self.tool_call_buffer: io.StringIO = io.StringIO()
         self.in_tool_call: bool = False
         self.accumulation_mode: bool = False
+        self._debug: bool = self.logger.isEnabledFor(logging.DEBUG)
+        # A random per-instance prefix keeps ids unique across workers and restarts; the
+        # counter is never reset, so they stay unique across every stream handled here
+        self._tool_call_id_prefix = f"call_{uuid.uuid4().hex[:16]}_"
+        self._tool_call_ids = itertools.count(1)
+
+    def _create_pattern_detector(self, pattern_config_path: str, pattern_backend: str):
+        """Create the buffered pattern processor for the requested backend.
+
+        Args:
+            pattern_config_path (str): Path to YAML config file containing tool call patterns.
+            pattern_backend (str): Either "aho-corasick" or "hyperscan".
+
+        Returns:
+            BaseBufferedProcessor: The pattern matching processor to use.
+        """
+        if pattern_backend == "hyperscan":
+            if hyperscan_available():
+                self.logger.info("Using Hyperscan pattern detection backend")
+                return HyperscanBufferedProcessorNormalized(pattern_config_path)
+            self.logger.warning("Hyperscan backend requested but 'hyperscan' is not installed; "
+                                "falling back to Aho-Corasick")
+        elif pattern_backend != "aho-corasick":
+            self.logger.warning("Unknown pattern backend '%s'; falling back to Aho-Corasick", pattern_backend)
+        return AhoCorasickBufferedProcessorNormalized(pattern_config_path)
 
     def reset(self) -> None:
         """Reset all internal state of the detection strategy.
@@ -65,10 +104,10 @@ class ManualToolCallDetectionStrategy(BaseToolCallDetectionStrategy):
         """
         self.logger.debug("Resetting detector state")
         self.pattern_detector.reset_states()
-        self.pre_tool_call_content = []
-        self.tool_call_buffer = ""
+        self.tool_call_buffer = io.StringIO()
         self.in_tool_call = False
         self.accumulation_mode = False
+        self._debug = self.logger.isEnabledFor(logging.DEBUG)
 
     async def detect_chunk(self, sse_chunk: SSEChunk, context: StreamContext) -> DetectionResult:
         """
@@ -92,7 +131,7 @@ class ManualToolCallDetectionStrategy(BaseToolCallDetectionStrategy):
 
         # If already in tool call detection mode, continue accumulating and report a partial match.
         if self.in_tool_call:
-            self.tool_call_buffer += chunk_content
+            self.tool_call_buffer.write(chunk_content)
             return DetectionResult(
                 state=DetectionState.PARTIAL_MATCH,
                 sse_chunk=sse_chunk
@@ -108,7 +147,8 @@ class ManualToolCallDetectionStrategy(BaseToolCallDetectionStrategy):
         # Return any content remaining that could have been in the same chunk as the patter or in a buffer
         if result.matched:
             self.in_tool_call = True
-            self.tool_call_buffer = result.text_with_tool_call
+            self.tool_call_buffer = io.StringIO(result.text_with_tool_call)
+            self.tool_call_buffer.seek(0, io.SEEK_END)
             return DetectionResult(
                 state=DetectionState.PARTIAL_MATCH,
                 content=result.output,
@@ -146,21 +186,31 @@ class ManualToolCallDetectionStrategy(BaseToolCallDetectionStrategy):
         if self.in_tool_call:
             self.logger.debug("Processing final tool call buffer")
             if final_result.output:
-                self.tool_call_buffer += final_result.output
+                self.tool_call_buffer.write(final_result.output)
 
             # Parse accumulated tool call
-            parsed_tool_call_data = self.tool_call_parser.parse(self.tool_call_buffer)
-            self.logger.debug(f"Tool call buffer: {self.tool_call_buffer}")
-            self.logger.debug(f"Parsed tool call data: {parsed_tool_call_data}")
-
-            if "error" in parsed_tool_call_data:
-                self.logger.error(f"Tool call parsing failed: {parsed_tool_call_data['error']}")
+            tool_call_text = self.tool_call_buffer.getvalue()
+            parsed_tool_call_data = self.tool_call_parser.parse(tool_call_text)
+            if self._debug:
+                self.logger.debug("Tool call buffer: %s", tool_call_text)
+                self.logger.debug("Parsed tool call data: %s", parsed_tool_call_data)
+
+            parse_error = parsed_tool_call_data.get("error")
+            if parse_error is not None:
+                self.logger.error("Tool call parsing failed: %s", parse_error)
                 return DetectionResult(
                     state=DetectionState.NO_MATCH,
                     content="Sorry, but I was unable to complete your request. Please try again.",
                 )
 
-            parsed_tool_calls = self._extract_tool_calls(parsed_tool_call_data)
+            try:
+                parsed_tool_calls = self._extract_tool_calls(parsed_tool_call_data)
+            except ValueError as e:
+                self.logger.error("Invalid tool call: %s", e)
+                return DetectionResult(
+                    state=DetectionState.NO_MATCH,
+                    content="Sorry, but I was unable to complete your request. Please try again.",
+                )
             self.logger.debug("Successfully parsed %d tool calls", len(parsed_tool_calls))
 
             return DetectionResult(
@@ -183,24 +233,34 @@ class ManualToolCallDetectionStrategy(BaseToolCallDetectionStrategy):
         """Extract structured tool calls from parsed JSON output.
 
         Converts the parsed JSON format into a list of ToolCall objects with
-        appropriate structure and typing.
+        appropriate structure and typing. Each tool call receives a unique id so
+        that tool results can be matched back to their calls.
 
         Args:
             parsed_output (dict): The parsed JSON output containing tool call data.
 
         Returns:
             List[ToolCall]: List of structured tool call objects ready for processing.
+
+        Raises:
+            ValueError: If a tool call's name is missing or not a string.
         """
         tool_calls = []
-        for tool_call_dict in parsed_output.get("tool_calls", []):
-            tool_call_args = tool_call_dict.get("parameters", tool_call_dict.get("arguments"))
-            self.logger.debug("Extracting tool call arguments: %s", tool_call_args)
-            tool_calls.append(ToolCall(
-                id='123456789',  # Placeholder ID; modify as needed
-                type=tool_call_dict.get("type", "function"),
-                function=FunctionDetail(
-                    name=tool_call_dict.get("name"),
-                    arguments=str(tool_call_args)
+        for tool_call_dict in parsed_output.get("tool_calls", ()):
+            # model_construct skips validation; the id, type and arguments are built
+            # here, but the name comes straight from the model output
+            name = tool_call_dict.get("name")
+            if not isinstance(name, str):
+                raise ValueError(f"Tool call name must be a string, got {type(name).__name__}")
+            tool_calls.append(ToolCall.model_construct(
+                id=f"{self._tool_call_id_prefix}{next(self._tool_call_ids)}",
+                type="function",
+                function=FunctionDetail.model_construct(
+                    name=name,
+                    arguments=str(tool_call_dict.get("parameters", tool_call_dict.get("arguments")))
                 )
             ))
+        if self._debug:
+            for tool_call in tool_calls:
+                self.logger.debug("Extracted tool call arguments: %s", tool_call.function.arguments)
         return tool_calls
@@ -92,6 +92,14 @@ class VendorToolCallDetectionStrategy(BaseToolCallDetectionStrategy):
         # Check if tool call data is present in this chunk
         tool_calls = delta.tool_calls if delta.tool_calls else None
 
+        # Fast path for the common text-only chunk: nothing to accumulate or finalize
+        if (tool_calls is None and finish_reason not in ("tool_calls", "tool_use")
+                and not self.partial_name and not self.partial_args):
+            return DetectionResult(
+                state=DetectionState.NO_MATCH,
+                content=text_content
+            )
+
         if tool_calls:
             tool_call_data = tool_calls[0]  # Assuming index 0 for simplicity
             function_name = tool_call_data.function.name if tool_call_data.function else None
@@ -106,7 +114,7 @@ class VendorToolCallDetectionStrategy(BaseToolCallDetectionStrategy):
                 self.partial_args += arguments
 
         # If finish_reason indicates the tool call is complete, finalize it
-        if finish_reason in ["tool_calls", "tool_use"]:
+        if finish_reason in ("tool_calls", "tool_use"):
             if self.partial_name:
                 try:
                     parsed_args = json.loads(self.partial_args) if self.partial_args else {}
@@ -114,9 +122,11 @@ class VendorToolCallDetectionStrategy(BaseToolCallDetectionStrategy):
                     self.logger.warning("Failed to parse arguments as JSON: %s", self.partial_args[:50])
                     parsed_args = {"_malformed": self.partial_args}
 
-                tool_call = ToolCall(
+                # Fields are built here from already-validated values, so skip Pydantic validation
+                tool_call = ToolCall.model_construct(
                     id=(tool_call_data and tool_call_data.id) or "call_generated",
-                    function=FunctionDetail(
+                    type="function",
+                    function=FunctionDetail.model_construct(
                         name=self.partial_name,
                         arguments=str(parsed_args)
                     )
@@ -170,7 +180,7 @@ class VendorToolCallDetectionStrategy(BaseToolCallDetectionStrategy):
 
         if self.partial_name or self.partial_args:
             self.logger.debug("Incomplete tool call data at stream end")
-            self.logger.debug(f"Name: {self.partial_name}, Args: {self.partial_args}")
+            self.logger.debug("Name: %s, Args: %s", self.partial_name, self.partial_args)
             return DetectionResult(state=DetectionState.NO_MATCH)
 
         self.logger.debug("No tool calls to finalize")
@@ -13,42 +13,70 @@ Environment Variables:
     LOG_LEVEL (str): Logging level for the application (default: 'INFO').
 """
 
-import os
+import sys
+import time
 import yaml
+import queue
+import atexit
 import logging
+from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
 from fastapi import FastAPI
 from starlette import status
-from dotenv import load_dotenv
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
 
 from src.api.sse_models import SSEChunk
-from src.api.routes.chat_completions_api import router as chat_completions_router
+from src.utils.settings import get_settings
+from src.utils.yaml_loader import YamlSafeLoader, libyaml_available
+from src.api.routes.chat_completions_api import router as chat_completions_router, get_streaming_agent
 
-# Load environment variables
-load_dotenv()
+# Environment variables (including .env) are read once into the settings object
+settings = get_settings()
 
 # Configure logging
-log_level = os.getenv("LOG_LEVEL", "INFO").upper()
-logging.basicConfig(
-    level=getattr(logging, log_level),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
+log_level = settings.log_level
+# Log records are queued by the request path and written to stderr by a background thread,
+# so handlers running on the event loop never block on stream I/O.
+_log_queue: queue.Queue = queue.Queue(-1)
+_log_stream_handler = logging.StreamHandler(sys.stderr)
+_log_stream_handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+_log_listener = QueueListener(_log_queue, _log_stream_handler)
+_log_queue_handler = QueueHandler(_log_queue)
+# Only merge args into the message here; the listener's handler applies the full format
+_log_queue_handler.setFormatter(logging.Formatter("%(message)s"))
+logging.basicConfig(level=getattr(logging, log_level), handlers=[_log_queue_handler])
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 logger.info("Initializing application with log level: %s", log_level)
+if not libyaml_available():
+    logger.warning("libyaml is not available; YAML configs will be parsed with the slower pure-Python loader. "
+                   "Reinstall PyYAML with libyaml support to enable the C loader.")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Close the agent's pooled tool resources (e.g. HTTP sessions) when the app shuts down."""
+    yield
+    logger.info("Shutting down; closing agent tools")
+    await get_streaming_agent().close()
+
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Chat Completions API",
     description="API for handling chat completions with streaming support",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # Load agent config to check for allowed_origins
 try:
     with open("src/configs/agent.yaml", "r") as file:
-        agent_config = yaml.safe_load(file)
+        agent_config = yaml.load(file, Loader=YamlSafeLoader)
 except Exception as e:
     logger.warning("Failed to load agent configuration for CORS: %s", str(e))
     agent_config = {}
@@ -78,6 +106,35 @@ app.include_router(chat_completions_router, prefix="/v1")
 # EXCEPTION HANDLERS
 # --------------------
 
+GENERIC_ERROR_CONTENT = "I apologize, but an error occurred while processing your request."
+
+# Serialized stop chunk reused by the generic exception handler; built on first use
+_generic_error_template: Optional[dict] = None
+
+
+async def _build_generic_error_content(refusal: str) -> dict:
+    """Build the JSON body for a generic error response.
+
+    The stop chunk is serialized once and cached; each call only copies the
+    parts that differ per response (id, timestamp and refusal message).
+
+    Args:
+        refusal (str): The error message to report in the refusal field.
+
+    Returns:
+        dict: A serialized SSE stop chunk.
+    """
+    global _generic_error_template
+    if _generic_error_template is None:
+        template_chunk = await SSEChunk.make_stop_chunk(content=GENERIC_ERROR_CONTENT)
+        _generic_error_template = template_chunk.model_dump()
+
+    now = time.time()
+    template_choice = _generic_error_template["choices"][0]
+    choice = {**template_choice, "delta": {**template_choice["delta"], "refusal": refusal}}
+    return {**_generic_error_template, "id": f"chatcmpl-{now}", "created": int(now), "choices": [choice]}
+
+
 @app.exception_handler(Exception)
 async def generic_exception_handler(request, exc: Exception):
     """Handle all unhandled exceptions globally.
@@ -106,14 +163,9 @@ async def generic_exception_handler(request, exc: Exception):
         logger.error("Unhandled exception occurred", exc_info=True)
 
     logger.debug("Generating error response chunk with status %d", status_code)
-    error_response = await SSEChunk.make_stop_chunk(
-        refusal=error_msg,
-        content="I apologize, but an error occurred while processing your request.",
-    )
-
     return JSONResponse(
         status_code=status_code,
-        content=error_response.model_dump(),
+        content=await _build_generic_error_content(error_msg),
     )
 
 
@@ -129,7 +181,7 @@ async def validation_exception_handler(request, exc: RequestValidationError):
         exc (RequestValidationError): The exception raised during request validation.
 
     Returns:
-        JSONResponse: A JSON response with a 422 status code and details about the validation errors.
+        Response: A JSON response with a 422 status code and details about the validation errors.
     """
     logger.warning("Request validation failed: %s", str(exc))
     logger.debug("Validation error details: %s", exc.errors())
@@ -139,7 +191,9 @@ async def validation_exception_handler(request, exc: RequestValidationError):
         content="There seems to be an issue with the provided request format. Please check your input and try again.",
     )
 
-    return JSONResponse(
+    # Serialize straight to JSON in pydantic-core instead of dumping to a dict and re-encoding it
+    return Response(
+        content=error_response.model_dump_json(),
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        content=error_response.model_dump(),
+        media_type="application/json",
     )
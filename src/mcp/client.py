@@ -1,9 +1,12 @@
 # src/mcp/client.py
 
+import math
 import anyio
 import logging
 from typing import Optional, Any, Dict, Callable, Awaitable
 
+from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
+
 from mcp import types
 from mcp import ClientSession
 from mcp.client.sse import sse_client
@@ -13,6 +16,14 @@ from src.tools.core.observer import MCPToolObserver
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_CONCURRENT_NOTIFICATIONS = 16
+
+# Server log level -> logger method; anything else is logged at INFO.
+_SERVER_LOG_METHODS: Dict[str, Callable[..., None]] = {
+    "error": logger.error,
+    "warning": logger.warning,
+}
+
 
 class FlexoMCPClient:
     """A client wrapper for the MCP SDK's ClientSession, supporting both SSE and Stdio transports.
@@ -24,6 +35,15 @@ class FlexoMCPClient:
         observer (MCPToolObserver): Observer instance for handling tool notifications.
     """
 
+    # Notification method -> name of the built-in handler method bound at connect time.
+    _DEFAULT_HANDLER_NAMES: tuple[tuple[str, str], ...] = (
+        ("notifications/tools/list_changed", "_handle_tools_list_changed"),
+        ("notifications/resources/list_changed", "_handle_resources_list_changed"),
+        ("notifications/prompts/list_changed", "_handle_prompts_list_changed"),
+        ("notifications/resources/updated", "_handle_resource_updated"),
+        ("notifications/logging/message", "_handle_logging_message"),
+    )
+
     def __init__(self, config: dict[str, Any]):
         """Initializes the FlexoMCPClient.
 
@@ -35,6 +55,7 @@ class FlexoMCPClient:
                     "command": <stdio command, e.g. 'python'>,
                     "args": <list of arguments for stdio process>,
                     "env": <dict of environment variables for stdio process>,
+                    "max_concurrent_notifications": <notification handlers allowed to run at once>,
                     ...
                 }
         """
@@ -44,6 +65,9 @@ class FlexoMCPClient:
         self._transport_cm = None
         self._connected = False
         self._task_group = None
+        self._notification_limiter: Optional[anyio.Semaphore] = None
+        # Notification method -> stream feeding that method's handler task; see _on_server_notification
+        self._notification_queues: Dict[str, MemoryObjectSendStream] = {}
         self._notification_handlers: Dict[str, Callable[[Any], Awaitable[None]]] = {}
         self.observer = MCPToolObserver()
 
@@ -87,11 +111,14 @@ class FlexoMCPClient:
 
         # Initialize the session.
         init_result = await self._session.initialize()
-        logger.info(f"Connected to server: {init_result.serverInfo.name} {init_result.serverInfo.version}")
+        logger.info("Connected to server: %s %s", init_result.serverInfo.name, init_result.serverInfo.version)
 
         self._register_default_notification_handlers()
 
         # Start message processor in a task group.
+        self._notification_limiter = anyio.Semaphore(
+            self.config.get("max_concurrent_notifications", DEFAULT_MAX_CONCURRENT_NOTIFICATIONS)
+        )
         self._task_group = anyio.create_task_group()
         await self._task_group.__aenter__()
         self._task_group.start_soon(self._process_incoming_messages)
@@ -111,7 +138,7 @@ class FlexoMCPClient:
             Exception: If connection fails.
         """
         sse_url = self.config.get("sse_url", "http://localhost:8080/sse")
-        logger.info(f"Connecting to SSE server at {sse_url}...")
+        logger.info("Connecting to SSE server at %s...", sse_url)
         self._transport_cm = sse_client(sse_url)
         self._streams = await self._transport_cm.__aenter__()
         self._session = ClientSession(self._streams[0], self._streams[1])
@@ -125,22 +152,15 @@ class FlexoMCPClient:
         args = self.config.get("args", [])
         env = self.config.get("env", None)
         server_params = StdioServerParameters(command=command, args=args, env=env)
-        logger.info(f"Connecting to stdio server with: {command} {args} ...")
+        logger.info("Connecting to stdio server with: %s %s ...", command, args)
         self._transport_cm = stdio_client(server_params)
         self._streams = await self._transport_cm.__aenter__()
         self._session = ClientSession(self._streams[0], self._streams[1])
 
     def _register_default_notification_handlers(self) -> None:
         """Registers the built-in notification handlers."""
-        handlers = {
-            "notifications/tools/list_changed": self._handle_tools_list_changed,
-            "notifications/resources/list_changed": self._handle_resources_list_changed,
-            "notifications/prompts/list_changed": self._handle_prompts_list_changed,
-            "notifications/resources/updated": self._handle_resource_updated,
-            "notifications/logging/message": self._handle_logging_message,
-        }
-        for method, handler in handlers.items():
-            self.register_notification_handler(method, handler)
+        for method, handler_name in self._DEFAULT_HANDLER_NAMES:
+            self.register_notification_handler(method, getattr(self, handler_name))
 
     async def close(self) -> None:
         """Gracefully closes the MCP client session and transport context."""
@@ -148,6 +168,10 @@ class FlexoMCPClient:
             self._task_group.cancel_scope.cancel()
             await self._task_group.__aexit__(None, None, None)
             self._task_group = None
+        for queue in self._notification_queues.values():
+            queue.close()
+        self._notification_queues.clear()
+        await self.observer.close()
 
         if self._connected and self._session:
             await self._session.__aexit__(None, None, None)
@@ -175,20 +199,62 @@ class FlexoMCPClient:
     async def _process_incoming_messages(self) -> None:
         """Processes incoming messages from the MCP server, including notifications."""
         logger.info("Starting message processor...")
+        # Bind once: the session doesn't change while the processor runs
+        session = self.session
         try:
-            async for message in self.session.incoming_messages:
+            async for message in session.incoming_messages:
                 if isinstance(message, Exception):
-                    logger.error(f"Error in MCP communication: {message}")
+                    logger.error("Error in MCP communication: %s", message)
                 elif isinstance(message, types.ServerNotification):
-                    # Attach the session to the notification.
-                    message.session = self.session
-                    await self._handle_notification(message)
+                    await self._on_server_notification(message)
                 # Additional message types (e.g., RequestResponder) can be handled here.
         except Exception as e:
-            logger.exception(f"Error in message processor: {e}")
+            logger.exception("Error in message processor: %s", e)
         finally:
             logger.info("Message processor stopped")
 
+    async def _on_server_notification(self, message: types.ServerNotification) -> None:
+        """Attaches the session to an incoming notification and queues it for its handler.
+
+        Each notification method gets its own task in the client's task group, which
+        handles that method's notifications one at a time in arrival order. A slow
+        handler never stalls reading of further messages, and notifications of
+        different methods are handled concurrently.
+
+        Args:
+            message (types.ServerNotification): The notification received from the server.
+        """
+        # The processor only runs on an open session, so skip the checked `session` property
+        message.session = self._session
+        method = message.root.method
+        queue = self._notification_queues.get(method)
+        if queue is None:
+            queue, received = anyio.create_memory_object_stream(math.inf)
+            self._notification_queues[method] = queue
+            self._task_group.start_soon(
+                self._handle_notifications_in_order, received, method.endswith("/list_changed")
+            )
+        queue.send_nowait(message)
+
+    async def _handle_notifications_in_order(
+        self, received: MemoryObjectReceiveStream, coalesce: bool
+    ) -> None:
+        """Handles the notifications of one method, one at a time, until the client closes.
+
+        Args:
+            received (MemoryObjectReceiveStream): Stream of notifications for the method.
+            coalesce (bool): Handle only the latest of the notifications queued at once.
+                Used for list_changed notifications, which carry no data.
+        """
+        async with received:
+            async for notification in received:
+                while coalesce:
+                    try:
+                        notification = received.receive_nowait()
+                    except (anyio.WouldBlock, anyio.EndOfStream):
+                        break
+                await self._handle_notification(notification)
+
     async def _handle_notification(self, notification: types.ServerNotification) -> None:
         """Handles server notifications based on their type.
 
@@ -196,16 +262,18 @@ class FlexoMCPClient:
             notification (types.ServerNotification): The notification received from the server.
         """
         method = notification.root.method
-        logger.debug(f"Received notification: {method}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Received notification: %s", method)
 
         handler = self._notification_handlers.get(method)
         if handler:
             try:
-                await handler(notification)
+                async with self._notification_limiter:
+                    await handler(notification)
             except Exception as e:
-                logger.exception(f"Error in notification handler for {method}: {e}")
+                logger.exception("Error in notification handler for %s: %s", method, e)
         else:
-            logger.info(f"Received unhandled notification: {method}")
+            logger.info("Received unhandled notification: %s", method)
 
     def register_notification_handler(
         self, method: str, handler: Callable[[Any], Awaitable[None]]
@@ -217,7 +285,7 @@ class FlexoMCPClient:
             handler (Callable[[Any], Awaitable[None]]): The asynchronous handler function.
         """
         self._notification_handlers[method] = handler
-        logger.debug(f"Registered handler for {method}")
+        logger.debug("Registered handler for %s", method)
 
     # --- Notification Handlers ---
     async def _handle_tools_list_changed(self, notification: types.ServerNotification) -> None:
@@ -263,17 +331,12 @@ class FlexoMCPClient:
             notification (types.ServerNotification): The notification containing logging info.
         """
         params = getattr(notification, "params", None)
-        if params and hasattr(params, "level") and hasattr(params, "message"):
-            level = params.level
-            message = params.message
-            if level == "error":
-                logger.error(f"MCP server log: {message}")
-            elif level == "warning":
-                logger.warning(f"MCP server log: {message}")
-            else:
-                logger.info(f"MCP server log: {message}")
-        else:
-            logger.info(f"MCP server log (format unknown): {params}")
+        try:
+            level, message = params.level, params.message
+        except AttributeError:
+            logger.info("MCP server log (format unknown): %s", params)
+            return
+        _SERVER_LOG_METHODS.get(level, logger.info)("MCP server log: %s", message)
 
     # --- Convenience Methods for Common Operations ---
     async def list_tools(self) -> types.ListToolsResult:
@@ -14,6 +14,8 @@ class DefaultMCPTool(BaseMCPTool):
     a basic execution behavior (which you can later customize).
     """
 
+    __slots__ = ()
+
     async def execute(self, context: Optional[StreamContext] = None, **kwargs) -> ToolResponse:
         # Default behavior: simply echo the provided arguments.
         result_text = f"Executed {self.name} with arguments: {kwargs}"
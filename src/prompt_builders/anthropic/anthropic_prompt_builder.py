@@ -1,16 +1,21 @@
 # src/prompt_builders/anthropic/anthropic_prompt_builder.py
 
-import yaml
 import logging
-from pathlib import Path
-from typing import Dict
-from datetime import datetime
+from typing import Dict, Tuple
+from functools import lru_cache
 
 from src.prompt_builders import BasePromptBuilder
+from src.prompt_builders.config_loader import load_prompt_builders_yaml
 from src.data_models.chat_completions import SystemMessage
 from src.prompt_builders.prompt_models import PromptPayload, PromptBuilderOutput
 
 
+@lru_cache(maxsize=64)
+def _format_tool_header(template: str, tool_names: Tuple[str, ...], date: str) -> str:
+    """Format the tool section header; cached since tools and date rarely change."""
+    return template.format(tools=", ".join(tool_names), date=date)
+
+
 class AnthropicPromptBuilder(BasePromptBuilder):
     """A prompt builder specialized for Anthropic chat completion models.
 
@@ -30,18 +35,22 @@ class AnthropicPromptBuilder(BasePromptBuilder):
         ```
     """
 
+    logger = logging.getLogger(__qualname__)
+
     def __init__(self):
         """Initialize the Anthropic prompt builder.
 
         Loads configuration from the prompt_builders.yaml file and sets up logging.
         Raises FileNotFoundError if the config file is not found.
         """
-        self.logger = logging.getLogger(self.__class__.__name__)
         self.logger.debug("Initializing AnthropicPromptBuilder")
         super().__init__()
         self.config = self._load_config()
+        system_prompt = self.config['system_prompt']
+        self._header_template = system_prompt['header']
+        self._tool_instructions = system_prompt['tool_instructions']
 
-    async def build_chat(self, payload: PromptPayload) -> PromptBuilderOutput:
+    def build_chat_sync(self, payload: PromptPayload) -> PromptBuilderOutput:
         """Build a chat completion prompt with optional tool definitions.
 
         Constructs a prompt by potentially modifying the conversation history to
@@ -69,27 +78,26 @@ class AnthropicPromptBuilder(BasePromptBuilder):
             return PromptBuilderOutput(chat_messages=conversation_history)
 
         # Extract tool names from the tool definitions.
-        tool_names = [tool.function.name for tool in tool_definitions]
+        tool_names = tuple(tool.function.name for tool in tool_definitions)
 
         # Build a header for the tool section using our config.
-        tool_section_header = self.config['system_prompt']['header'].format(
-            tools=", ".join(tool_names),
-            date=datetime.now().strftime('%Y-%m-%d')
+        tool_section_header = _format_tool_header(
+            self._header_template,
+            tool_names,
+            self._current_date()
         )
-        tool_instructions = self.config['system_prompt']['tool_instructions']
 
         # Build the tool information block.
-        tool_info = await self._build_system_content(tool_definitions, tool_section_header, tool_instructions)
-        modified_history = conversation_history.copy()
-
-        if conversation_history and isinstance(conversation_history[0], SystemMessage):
+        tool_info = self._build_system_content_sync(tool_definitions, tool_section_header, self._tool_instructions)
+        # Build the new history in a single pass rather than copying and shifting it.
+        if conversation_history and conversation_history[0].role == 'system':
             existing_content = conversation_history[0].content
-            modified_history[0] = SystemMessage(
-                content=f"## tools:\n\n{existing_content}\n{tool_info}\n\n"
-            )
+            modified_history = [
+                SystemMessage(content=f"## tools:\n\n{existing_content}\n{tool_info}\n\n"),
+                *conversation_history[1:]
+            ]
         else:
-            system_msg = SystemMessage(content=tool_info)
-            modified_history.insert(0, system_msg)
+            modified_history = [SystemMessage(content=tool_info), *conversation_history]
 
         self.logger.debug("Returning modified history with %d messages", len(modified_history))
         return PromptBuilderOutput(chat_messages=modified_history)
@@ -111,6 +119,9 @@ class AnthropicPromptBuilder(BasePromptBuilder):
     def _load_config() -> Dict:
         """Load the Anthropic-specific configuration from the prompt builders YAML file.
 
+        The file is parsed once per process and shared with the other builders;
+        the returned dictionary must be treated as read-only.
+
         Returns:
             Dict: Configuration dictionary containing Anthropic-specific settings.
 
@@ -118,7 +129,12 @@ class AnthropicPromptBuilder(BasePromptBuilder):
             FileNotFoundError: If the config file doesn't exist.
             yaml.YAMLError: If the config file is malformed.
         """
-        config_path = Path("src/configs/prompt_builders.yaml")
-        with config_path.open() as f:
-            config = yaml.safe_load(f)
-            return config.get('anthropic', {})
+        return load_prompt_builders_yaml().get('anthropic', {})
+
+
+# Parse the config while the module is imported at worker startup instead of on the first request.
+# Failures are only logged here; the builder raises them again when it is constructed.
+try:
+    AnthropicPromptBuilder._load_config()
+except Exception as e:  # e.g. a missing file or a YAML error
+    logging.getLogger(__name__).warning("Could not preload Anthropic prompt builder config: %s", str(e))
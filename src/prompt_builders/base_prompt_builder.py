@@ -1,12 +1,93 @@
 # src/prompt_builders/base_prompt_builder.py
 
-from typing import List
+import time
+import weakref
+from functools import lru_cache
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+from datetime import datetime, timedelta
 
-from src.data_models.tools import Tool
-from src.data_models.chat_completions import TextChatMessage
+from src.data_models.tools import Tool, FunctionParameters
+from src.data_models.chat_completions import TextChatMessage, SystemMessage, UserMessage, ToolMessage
 from src.prompt_builders.prompt_models import PromptPayload, PromptBuilderOutput
 
+if TYPE_CHECKING:
+    # jinja2 is only imported when a template-based builder loads its template
+    from jinja2 import Environment, Template
+
+# Serialized parameter schemas keyed by id() of the FunctionParameters they came from.
+# Pydantic models are unhashable, so entries are evicted with weakref.finalize instead
+# of living in a WeakKeyDictionary.
+_parameters_json_cache: Dict[int, str] = {}
+
+
+def _cached_parameters_json(parameters: FunctionParameters) -> str:
+    """Return `parameters.model_dump_json()`, serializing each instance only once.
+
+    Tool definitions are not mutated after creation, so the JSON for a given
+    instance can be reused for every prompt built with it.
+
+    Args:
+        parameters (FunctionParameters): The tool parameter schema to serialize.
+
+    Returns:
+        str: The JSON representation of the parameter schema.
+    """
+    key = id(parameters)
+    params_json = _parameters_json_cache.get(key)
+    if params_json is None:
+        params_json = parameters.model_dump_json()
+        _parameters_json_cache[key] = params_json
+        weakref.finalize(parameters, _parameters_json_cache.pop, key, None)
+    return params_json
+
+
+# (name, description, parameters JSON or None) for each tool; see BasePromptBuilder._tool_entries
+ToolEntries = Tuple[Tuple[str, Optional[str], Optional[str]], ...]
+
+# Template-ready tool dicts keyed by (formatter, id() of the Tool they came from); evicted
+# with weakref.finalize like _parameters_json_cache.
+_template_tool_cache: Dict[Tuple[Callable[[Tool], dict], int], dict] = {}
+
+
+@lru_cache(maxsize=32)
+def _join_system_content(header: str, instructions: str, tool_entries: ToolEntries) -> str:
+    """Assemble the tool system message from its parts.
+
+    Cached because the same tool set, header and instructions produce the same
+    content for every request until the tools or the date in the header change.
+
+    Args:
+        header (str): Header text for the system message.
+        instructions (str): Instructions text for tool usage.
+        tool_entries (ToolEntries): Tool key from `BasePromptBuilder._tool_entries`.
+
+    Returns:
+        str: Formatted system message content with tool information.
+    """
+    tool_sections = "\n".join(
+        f"Use the function '{name}' to: {description}\n{params_json}\n"
+        for name, description, params_json in tool_entries
+    )
+    return f"{header}\n\n{instructions}\n\n{tool_sections}"
+
+
+@lru_cache(maxsize=None)
+def _jinja_environment(template_dir: str) -> "Environment":
+    """Return the shared Jinja2 environment for a template directory.
+
+    The environment caches compiled templates, so every builder instance using
+    the same directory shares one compiled copy of each template. Templates are
+    never reloaded from disk once compiled.
+    """
+    from jinja2 import Environment, FileSystemLoader
+
+    return Environment(loader=FileSystemLoader(template_dir), auto_reload=False)
+
+
+# Formatted dates keyed by strftime format: (formatted date, epoch time of the next local midnight)
+_current_date_cache: Dict[str, Tuple[str, float]] = {}
+
 
 class BasePromptBuilder(ABC):
     @abstractmethod
@@ -23,22 +104,43 @@ class BasePromptBuilder(ABC):
         """
         pass
 
-    @abstractmethod
     async def build_chat(self, payload: PromptPayload) -> PromptBuilderOutput:
         """
         Build message list for chat completions endpoint.
 
+        Async wrapper around `build_chat_sync`, kept so chat and text prompts can
+        be built through the same awaitable interface.
+
         Args:
             payload (PromptPayload): The structured input containing conversation history,
                                    tool definitions, and other context-specific data.
 
         Returns:
-            PromptBuilderOutput: Contains either text_prompt or chat_messages for the LLM
+            PromptBuilderOutput: Same as `build_chat_sync`.
+        """
+        return self.build_chat_sync(payload)
+
+    @abstractmethod
+    def build_chat_sync(self, payload: PromptPayload) -> PromptBuilderOutput:
+        """
+        Build message list for chat completions endpoint.
+
+        Building chat messages does no I/O, so it is synchronous; the streaming
+        agent calls it directly instead of awaiting `build_chat`.
+
+        Args:
+            payload (PromptPayload): The structured input containing conversation history,
+                                   tool definitions, and other context-specific data.
+
+        Returns:
+            PromptBuilderOutput: Contains either text_prompt or chat_messages for the LLM.
+                Implementations return the input history unchanged when there is
+                nothing to add (e.g. no tools), so callers must not mutate it.
         """
         pass
 
     @staticmethod
-    async def _build_system_content(tool_definitions: List[Tool], header: str, instructions: str) -> str:
+    def _build_system_content_sync(tool_definitions: List[Tool], header: str, instructions: str) -> str:
         """Build system message content incorporating tool information.
 
         Args:
@@ -52,15 +154,116 @@ class BasePromptBuilder(ABC):
         Note:
             Should only be called when tool_definitions is non-empty.
         """
-        tool_sections = []
-        for tool in tool_definitions:
-            tool_str = (
-                f"Use the function '{tool.function.name}' to: {tool.function.description}\n"
-                f"{tool.function.parameters.model_dump_json()}\n"
+        return _join_system_content(header, instructions, BasePromptBuilder._tool_entries(tool_definitions))
+
+    @staticmethod
+    def _tool_entries(tool_definitions: List[Tool]) -> ToolEntries:
+        """Reduce tool definitions to a hashable key for caching formatted tool sections.
+
+        Output derived from tools is cached on this key rather than on the `Tool`
+        objects, so it is shared between registries and tools with equal content.
+
+        Args:
+            tool_definitions (List[Tool]): Tool definitions to describe.
+
+        Returns:
+            ToolEntries: (name, description, parameters JSON or None) for each
+                tool, in order.
+        """
+        return tuple(
+            (
+                tool.function.name,
+                tool.function.description,
+                _cached_parameters_json(tool.function.parameters) if tool.function.parameters is not None else None,
             )
-            tool_sections.append(tool_str)
+            for tool in tool_definitions
+        )
+
+    def _format_tools_for_template(self, tool_definitions: List[Tool]) -> List[dict]:
+        """Format tool definitions for a Jinja template, reusing earlier results.
+
+        Each tool is passed through the builder's `_format_tool_for_template` once;
+        later builds with the same `Tool` instance reuse the resulting dict, which
+        templates only read.
+
+        Args:
+            tool_definitions (List[Tool]): Tool definitions to format.
+
+        Returns:
+            List[dict]: One template-ready dict per tool, in order.
+        """
+        formatter = self._format_tool_for_template
+        formatted = []
+        for tool in tool_definitions:
+            key = (formatter, id(tool))
+            tool_dict = _template_tool_cache.get(key)
+            if tool_dict is None:
+                tool_dict = formatter(tool)
+                _template_tool_cache[key] = tool_dict
+                weakref.finalize(tool, _template_tool_cache.pop, key, None)
+            formatted.append(tool_dict)
+        return formatted
+
+    @staticmethod
+    def _message_to_dict(message: TextChatMessage) -> dict:
+        """Return the same dict as `message.model_dump()`, skipping pydantic for plain messages.
+
+        System, tool and string-content user messages have only scalar fields, so
+        their dicts are built directly. Anything else (assistant messages with their
+        custom dump, list content, subclasses) goes through `model_dump()`.
+
+        Args:
+            message (TextChatMessage): The message to convert.
+
+        Returns:
+            dict: The message as a plain dictionary.
+        """
+        message_type = type(message)
+        if message_type is SystemMessage:
+            return {"role": message.role, "content": message.content}
+        if message_type is UserMessage and isinstance(message.content, str):
+            return {"role": message.role, "content": message.content}
+        if message_type is ToolMessage:
+            return {"role": message.role, "content": message.content, "tool_call_id": message.tool_call_id}
+        return message.model_dump()
+
+    @staticmethod
+    def _load_jinja_template(template_dir: str, template_name: str) -> "Template":
+        """Load a Jinja2 template through the environment shared for its directory.
+
+        Args:
+            template_dir (str): Directory containing the template file.
+            template_name (str): File name of the template within `template_dir`.
+
+        Returns:
+            Template: The compiled template, compiled once per process.
+        """
+        return _jinja_environment(str(template_dir)).get_template(template_name)
+
+    @staticmethod
+    def _current_date(date_format: str = '%Y-%m-%d') -> str:
+        """Return today's local date formatted with `date_format`.
+
+        The formatted value is cached until the next local midnight, so prompt
+        builds only pay for a `time.time()` call instead of `datetime.now()`
+        plus `strftime`.
+
+        Args:
+            date_format (str): A `strftime` format string.
+
+        Returns:
+            str: The formatted current date.
+        """
+        now = time.time()
+        cached = _current_date_cache.get(date_format)
+        if cached is not None and now < cached[1]:
+            return cached[0]
 
-        return f"{header}\n\n{instructions}\n\n" + "\n".join(tool_sections)
+        today = datetime.fromtimestamp(now)
+        next_midnight = datetime.combine(today.date() + timedelta(days=1), datetime.min.time())
+        formatted = today.strftime(date_format)
+        _current_date_cache[date_format] = (formatted, next_midnight.timestamp())
+        return formatted
 
     @staticmethod
     def _format_conversation_history(
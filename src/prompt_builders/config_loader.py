@@ -0,0 +1,37 @@
+# src/prompt_builders/config_loader.py
+
+from typing import Dict
+from pathlib import Path
+from functools import lru_cache
+
+from src.utils.precompile_config import load_precompiled_config
+
+PROMPT_BUILDERS_CONFIG_PATH = "src/configs/prompt_builders.yaml"
+
+
+@lru_cache(maxsize=1)
+def load_prompt_builders_yaml() -> Dict:
+    """Load the shared prompt builders configuration.
+
+    Uses the module generated by `python -m src.utils.precompile_config` when it
+    is up to date, and parses the YAML file otherwise. The result is cached per
+    process and shared by every prompt builder; callers must treat the returned
+    dictionary as read-only.
+
+    Returns:
+        Dict: The full parsed configuration, keyed by builder section name.
+
+    Raises:
+        FileNotFoundError: If the config file doesn't exist.
+        yaml.YAMLError: If the config file is malformed.
+    """
+    config = load_precompiled_config(PROMPT_BUILDERS_CONFIG_PATH)
+    if config is not None:
+        return config
+
+    # PyYAML is only needed when the precompiled module is missing or stale
+    import yaml
+    from src.utils.yaml_loader import YamlSafeLoader
+
+    with Path(PROMPT_BUILDERS_CONFIG_PATH).open() as f:
+        return yaml.load(f, Loader=YamlSafeLoader)
@@ -1,12 +1,10 @@
 # src/prompt_builders/openai/openai_prompt_builder.py
 
-import yaml
 import logging
-from pathlib import Path
 from typing import Dict
-from datetime import datetime
 
 from src.prompt_builders import BasePromptBuilder
+from src.prompt_builders.config_loader import load_prompt_builders_yaml
 from src.data_models.chat_completions import SystemMessage
 from src.prompt_builders.prompt_models import PromptPayload, PromptBuilderOutput
 
@@ -37,18 +35,22 @@ class OpenAIPromptBuilder(BasePromptBuilder):
         ```
     """
 
+    logger = logging.getLogger(__qualname__)
+
     def __init__(self):
         """Initialize the OpenAI prompt builder.
 
         Loads configuration from the prompt_builders.yaml file and sets up logging.
         Raises FileNotFoundError if the config file is not found.
         """
-        self.logger = logging.getLogger(self.__class__.__name__)
         self.logger.debug("Initializing OpenAIPromptBuilder")
         super().__init__()
         self.config = self._load_config()
+        system_prompt = self.config['system_prompt']
+        self._header_template = system_prompt['header']
+        self._tool_instructions = system_prompt['tool_instructions']
 
-    async def build_chat(self, payload: PromptPayload) -> PromptBuilderOutput:
+    def build_chat_sync(self, payload: PromptPayload) -> PromptBuilderOutput:
         """Build a chat completion prompt with optional tool definitions.
 
         Constructs a prompt by potentially modifying the conversation history to
@@ -76,24 +78,20 @@ class OpenAIPromptBuilder(BasePromptBuilder):
             self.logger.debug("No tool definitions provided, returning original history")
             return PromptBuilderOutput(chat_messages=conversation_history)
 
-        tool_names = [tool.function.name for tool in tool_definitions]
-
-        tool_section_header = self.config['system_prompt']['header'].format(
-            tools=", ".join(tool_names),
-            date=datetime.now().strftime('%Y-%m-%d')
+        tool_section_header = self._header_template.format(
+            tools=", ".join(tool.function.name for tool in tool_definitions),
+            date=self._current_date()
         )
-        tool_instructions = self.config['system_prompt']['tool_instructions']
-        tool_info = await self._build_system_content(tool_definitions, tool_section_header, tool_instructions)
-        modified_history = conversation_history.copy()
+        tool_info = self._build_system_content_sync(tool_definitions, tool_section_header, self._tool_instructions)
 
-        if conversation_history and isinstance(conversation_history[0], SystemMessage):
+        if conversation_history and conversation_history[0].role == 'system':
             existing_content = conversation_history[0].content
-            modified_history[0] = SystemMessage(
-                content=f"## tools:\n\n{existing_content}\n{tool_info}\n\n"
-            )
+            modified_history = [
+                SystemMessage(content=f"## tools:\n\n{existing_content}\n{tool_info}\n\n"),
+                *conversation_history[1:]
+            ]
         else:
-            system_msg = SystemMessage(content=tool_info)
-            modified_history.insert(0, system_msg)
+            modified_history = [SystemMessage(content=tool_info), *conversation_history]
 
         self.logger.debug("Returning modified history with %d messages", len(modified_history))
         return PromptBuilderOutput(chat_messages=modified_history)
@@ -122,7 +120,4 @@ class OpenAIPromptBuilder(BasePromptBuilder):
             FileNotFoundError: If the config file doesn't exist.
             yaml.YAMLError: If the config file is malformed.
         """
-        config_path = Path("src/configs/prompt_builders.yaml")
-        with config_path.open() as f:
-            config = yaml.safe_load(f)
-            return config.get('openai', {})
+        return load_prompt_builders_yaml().get('openai', {})
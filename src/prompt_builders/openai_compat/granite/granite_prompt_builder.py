@@ -1,16 +1,16 @@
 # src/prompt_builders/openai_compat/granite/granite_prompt_builder.py
 
-import yaml
 import logging
-from pathlib import Path
-from jinja2 import Template
-from typing import Optional
-from datetime import datetime
+from typing import TYPE_CHECKING, Optional
 
 from src.data_models.tools import Tool
 from src.prompt_builders.base_prompt_builder import BasePromptBuilder
+from src.prompt_builders.config_loader import load_prompt_builders_yaml
 from src.prompt_builders.prompt_models import PromptPayload, PromptBuilderOutput
-from src.data_models.chat_completions import TextChatMessage, SystemMessage, UserMessage
+from src.data_models.chat_completions import TextChatMessage, SystemMessage, UserMessage, UserTextContent
+
+if TYPE_CHECKING:
+    from jinja2 import Template
 
 
 class OpenAICompatGranitePromptBuilder(BasePromptBuilder):
@@ -24,6 +24,8 @@ class OpenAICompatGranitePromptBuilder(BasePromptBuilder):
         config (Dict): Configuration loaded from prompt_builders.yaml
         template (Template): Jinja2 template for text generation prompts
     """
+    logger = logging.getLogger(__qualname__)
+
     def __init__(self, template_dir: Optional[str] = None):
         """Initialize the Granite prompt builder.
 
@@ -32,11 +34,13 @@ class OpenAICompatGranitePromptBuilder(BasePromptBuilder):
                 If None, uses default directory 'src/prompt_builders/granite'.
         """
         super().__init__()
-        self.logger = logging.getLogger(self.__class__.__name__)
         self.config = self._load_config()
+        system_prompt = self.config['system_prompt']
+        self._header_template = system_prompt['header']
+        self._tool_instructions = system_prompt['tool_instructions']
         self.template = self._load_template(template_dir) if template_dir else self._load_template()
 
-    async def build_chat(self, payload: PromptPayload) -> PromptBuilderOutput:
+    def build_chat_sync(self, payload: PromptPayload) -> PromptBuilderOutput:
         """Build chat messages with tools embedded in system message.
 
         Creates or modifies the system message to include tool definitions
@@ -57,28 +61,23 @@ class OpenAICompatGranitePromptBuilder(BasePromptBuilder):
             return PromptBuilderOutput(chat_messages=conversation_history)
 
         # Generate tool information
-        tool_names = [tool.function.name for tool in tool_definitions]
-        tool_section_header = self.config['system_prompt']['header'].format(
-            tools=", ".join(tool_names),
-            date=datetime.now().strftime('%Y-%m-%d')
+        tool_section_header = self._header_template.format(
+            tools=", ".join(tool.function.name for tool in tool_definitions),
+            date=self._current_date()
         )
-        tool_instructions = self.config['system_prompt']['tool_instructions']
 
-        tool_info = await self._build_system_content(tool_definitions, tool_section_header, tool_instructions)
+        tool_info = self._build_system_content_sync(tool_definitions, tool_section_header, self._tool_instructions)
 
-        # Create modified history list
-        modified_history = conversation_history.copy()
-
-        if conversation_history and isinstance(conversation_history[0], SystemMessage):
+        if conversation_history and conversation_history[0].role == 'system':
             # Prepend tool info to existing system message
             existing_content = conversation_history[0].content
-            modified_history[0] = SystemMessage(
-                content=f"{existing_content}\n<|start_of_role|>tools<|end_of_role|>{tool_info}<|end_of_text|>"
-            )
+            modified_history = [
+                SystemMessage(content=f"{existing_content}\n<|start_of_role|>tools<|end_of_role|>{tool_info}<|end_of_text|>"),
+                *conversation_history[1:]
+            ]
         else:
             # Create new system message with tool info and prepend to history
-            system_msg = SystemMessage(content=tool_info)
-            modified_history.insert(0, system_msg)
+            modified_history = [SystemMessage(content=tool_info), *conversation_history]
 
         return PromptBuilderOutput(chat_messages=modified_history)
 
@@ -99,13 +98,10 @@ class OpenAICompatGranitePromptBuilder(BasePromptBuilder):
         tool_definitions = payload.tool_definitions or []
 
         # Preprocess conversation history to flatten user message content
-        processed_history = [self._preprocess_message(msg).model_dump() for msg in conversation_history]
+        processed_history = [self._message_to_dict(self._preprocess_message(msg)) for msg in conversation_history]
 
         # Format tool definitions for template
-        formatted_tools = [
-            self._format_tool_for_template(tool)
-            for tool in tool_definitions
-        ] if tool_definitions else None
+        formatted_tools = self._format_tools_for_template(tool_definitions) if tool_definitions else None
 
         # Prepare template variables
         template_vars = {
@@ -113,8 +109,8 @@ class OpenAICompatGranitePromptBuilder(BasePromptBuilder):
             'tools': formatted_tools,
             'tools_in_user_message': False,
             'add_generation_prompt': True,
-            'date_string': datetime.now().strftime("%d %b %Y"),
-            'tool_instructions': self.config['system_prompt']['tool_instructions']
+            'date_string': self._current_date("%d %b %Y"),
+            'tool_instructions': self._tool_instructions
         }
         self.logger.debug(f'template_vars: {template_vars}')
 
@@ -127,14 +123,10 @@ class OpenAICompatGranitePromptBuilder(BasePromptBuilder):
             return message
 
         if isinstance(message.content, list):
-            # Extract text content from array of content objects
-            text_contents = []
-            for content in message.content:
-                if getattr(content, 'type', None) == 'text':
-                    text_contents.append(content.text)
-
-            # Create new UserMessage with flattened content
-            return UserMessage(content=" ".join(text_contents))
+            # Flatten the text parts; content items are typed models, so an isinstance check suffices
+            return UserMessage(content=" ".join([
+                content.text for content in message.content if isinstance(content, UserTextContent)
+            ]))
 
         return message
 
@@ -154,14 +146,9 @@ class OpenAICompatGranitePromptBuilder(BasePromptBuilder):
     @staticmethod
     def _load_config() -> dict:
         """Load Granite-specific configuration from YAML file."""
-        config_path = Path("src/configs/prompt_builders.yaml")
-        with config_path.open() as f:
-            config = yaml.safe_load(f)
-            return config.get('openai-compat-granite')
+        return load_prompt_builders_yaml().get('openai-compat-granite')
 
     @staticmethod
-    def _load_template(template_dir: str = "src/prompt_builders/openai_compat/granite") -> Template:
+    def _load_template(template_dir: str = "src/prompt_builders/openai_compat/granite") -> "Template":
         """Load Jinja2 template for Granite prompt generation."""
-        template_path = Path(template_dir) / "granite-3.1-8b.jinja"
-        with open(template_path) as f:
-            return Template(f.read())
+        return BasePromptBuilder._load_jinja_template(template_dir, "granite-3.1-8b.jinja")
@@ -1,18 +1,23 @@
 # src/data_models/prompt_models.py
 
-from pydantic import BaseModel, Field
+from dataclasses import dataclass
 from typing import List, Optional, Union
 
 from src.data_models.tools import Tool
 from src.data_models.chat_completions import TextChatMessage
 
 
-class PromptPayload(BaseModel):
+@dataclass(slots=True)
+class PromptPayload:
     """Container for prompt generation input data.
 
     This class encapsulates the necessary data for generating prompts,
     including conversation history and available tools.
 
+    This is a plain slotted dataclass rather than a Pydantic model: one is
+    created on every streaming iteration from messages and tools that have
+    already been validated, so it is not validated again.
+
     Attributes:
         conversation_history (List[TextChatMessage]): The complete conversation
             history as a chronological list of messages between user and assistant.
@@ -21,17 +26,12 @@ class PromptPayload(BaseModel):
             are available.
     """
 
-    conversation_history: List[TextChatMessage] = Field(
-        ...,
-        description="The conversation history as a list of messages"
-    )
-    tool_definitions: Optional[List[Tool]] = Field(
-        None,
-        description="Available tools that can be used by the model"
-    )
+    conversation_history: List[TextChatMessage]
+    tool_definitions: Optional[List[Tool]] = None
 
 
-class PromptBuilderOutput(BaseModel):
+@dataclass(slots=True)
+class PromptBuilderOutput:
     """Output container for prompt builder results.
 
     Stores either a text prompt or a list of chat messages, providing
@@ -42,6 +42,11 @@ class PromptBuilderOutput(BaseModel):
             prompt. Mutually exclusive with chat_messages.
         chat_messages (Optional[List[TextChatMessage]]): A list of chat messages
             representing the prompt. Mutually exclusive with text_prompt.
+
+    Note:
+        Builders may return the caller's conversation history (or its message
+        objects) as `chat_messages` without copying, e.g. when no tools are
+        defined. Consumers must treat the list and its messages as read-only.
     """
 
     text_prompt: Optional[str] = None
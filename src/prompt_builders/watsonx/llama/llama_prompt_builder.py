@@ -1,16 +1,16 @@
 # src/prompt_builders/llama/llama_prompt_builder.py
 
-from typing import Optional
-from datetime import datetime
-from jinja2 import Template
-import yaml
-from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
 from src.prompt_builders.base_prompt_builder import BasePromptBuilder
+from src.prompt_builders.config_loader import load_prompt_builders_yaml
 from src.prompt_builders.prompt_models import PromptPayload, PromptBuilderOutput
-from src.data_models.chat_completions import TextChatMessage, SystemMessage, UserMessage
+from src.data_models.chat_completions import TextChatMessage, SystemMessage, UserMessage, UserTextContent
 from src.data_models.tools import Tool
 
+if TYPE_CHECKING:
+    from jinja2 import Template
+
 
 class WatsonXLlamaPromptBuilder(BasePromptBuilder):
     """Prompt builder for the Llama model architecture.
@@ -49,9 +49,13 @@ class WatsonXLlamaPromptBuilder(BasePromptBuilder):
         """
         super().__init__()
         self.config = self._load_config()
+        system_prompt = self.config['system_prompt']
+        self._header_template = system_prompt['header']
+        self._tool_instructions = system_prompt['tool_instructions']
+        self._bos_token = self.config['tokens']['begin_text']
         self.template = self._load_template(template_dir) if template_dir else self._load_template()
 
-    async def build_chat(self, payload: PromptPayload) -> PromptBuilderOutput:
+    def build_chat_sync(self, payload: PromptPayload) -> PromptBuilderOutput:
         """Build chat messages with tools embedded in system message.
 
         Creates or modifies the system message to include tool definitions
@@ -70,21 +74,20 @@ class WatsonXLlamaPromptBuilder(BasePromptBuilder):
         if not tool_definitions:
             return PromptBuilderOutput(chat_messages=conversation_history)
 
-        tool_names = [tool.function.name for tool in tool_definitions]
-        tool_section_header = self.config['system_prompt']['header'].format(
-            tools=", ".join(tool_names),
-            date=datetime.now().strftime('%Y-%m-%d')
+        tool_section_header = self._header_template.format(
+            tools=", ".join(tool.function.name for tool in tool_definitions),
+            date=self._current_date()
         )
-        tool_instructions = self.config['system_prompt']['tool_instructions']
-        tool_info = await self._build_system_content(tool_definitions, tool_section_header, tool_instructions)
-        modified_history = conversation_history.copy()
+        tool_info = self._build_system_content_sync(tool_definitions, tool_section_header, self._tool_instructions)
 
-        if conversation_history and isinstance(conversation_history[0], SystemMessage):
+        if conversation_history and conversation_history[0].role == 'system':
             existing_content = conversation_history[0].content
-            modified_history[0] = SystemMessage(content=f"{tool_info}\n{existing_content}")
+            modified_history = [
+                SystemMessage(content=f"{tool_info}\n{existing_content}"),
+                *conversation_history[1:]
+            ]
         else:
-            system_msg = SystemMessage(content=tool_info)
-            modified_history.insert(0, system_msg)
+            modified_history = [SystemMessage(content=tool_info), *conversation_history]
 
         return PromptBuilderOutput(chat_messages=modified_history)
 
@@ -106,13 +109,10 @@ class WatsonXLlamaPromptBuilder(BasePromptBuilder):
         tool_definitions = payload.tool_definitions or []
 
         # Preprocess conversation history to flatten user message content
-        processed_history = [self._preprocess_message(msg).model_dump() for msg in conversation_history]
+        processed_history = [self._message_to_dict(self._preprocess_message(msg)) for msg in conversation_history]
 
         # Format tool definitions for template
-        formatted_tools = [
-            self._format_tool_for_template(tool)
-            for tool in tool_definitions
-        ] if tool_definitions else None
+        formatted_tools = self._format_tools_for_template(tool_definitions) if tool_definitions else None
 
         # Prepare template variables
         template_vars = {
@@ -120,9 +120,9 @@ class WatsonXLlamaPromptBuilder(BasePromptBuilder):
             'tools': formatted_tools,
             'tools_in_user_message': False,
             'add_generation_prompt': True,
-            'date_string': datetime.now().strftime("%d %b %Y"),
-            'bos_token': self.config['tokens']['begin_text'],
-            'tool_instructions': self.config['system_prompt']['tool_instructions']
+            'date_string': self._current_date("%d %b %Y"),
+            'bos_token': self._bos_token,
+            'tool_instructions': self._tool_instructions
         }
 
         return PromptBuilderOutput(text_prompt=self.template.render(**template_vars))
@@ -134,31 +134,22 @@ class WatsonXLlamaPromptBuilder(BasePromptBuilder):
             return message
 
         if isinstance(message.content, list):
-            # Extract text content from array of content objects
-            text_contents = []
-            for content in message.content:
-                if getattr(content, 'type', None) == 'text':
-                    text_contents.append(content.text)
-
-            # Create new UserMessage with flattened content
-            return UserMessage(content=" ".join(text_contents))
+            # Flatten the text parts; content items are typed models, so an isinstance check suffices
+            return UserMessage(content=" ".join([
+                content.text for content in message.content if isinstance(content, UserTextContent)
+            ]))
 
         return message
 
     @staticmethod
     def _load_config() -> dict:
         """Load Llama-specific configuration from YAML file."""
-        config_path = Path("src/configs/prompt_builders.yaml")
-        with config_path.open() as f:
-            config = yaml.safe_load(f)
-            return config.get('watsonx-llama')
+        return load_prompt_builders_yaml().get('watsonx-llama')
 
     @staticmethod
-    def _load_template(template_dir: str = "src/prompt_builders/watsonx/llama") -> Template:
+    def _load_template(template_dir: str = "src/prompt_builders/watsonx/llama") -> "Template":
         """Load Jinja2 template for Llama prompt generation."""
-        template_path = Path(template_dir) / "llama-3.3-70b.jinja"
-        with open(template_path) as f:
-            return Template(f.read())
+        return BasePromptBuilder._load_jinja_template(template_dir, "llama-3.3-70b.jinja")
 
     @staticmethod
     def _format_tool_for_template(tool: Tool) -> dict:
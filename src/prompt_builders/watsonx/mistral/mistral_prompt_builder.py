@@ -1,11 +1,11 @@
 # prompt_builders/mistral/mistral_prompt_builder.py
 
-import yaml
 import json
+import hashlib
 import logging
-from pathlib import Path
-from typing import List, Dict
-from datetime import datetime
+from functools import lru_cache
+from collections import OrderedDict
+from typing import List, Dict, Tuple
 from mistral_common.protocol.instruct.messages import (
     UserMessage as MistralUserMessage,
     AssistantMessage as MistralAssistantMessage,
@@ -17,6 +17,8 @@ from mistral_common.protocol.instruct.messages import (
 )
 from mistral_common.tokens.tokenizers.mistral import MistralTokenizer
 from mistral_common.protocol.instruct.request import ChatCompletionRequest
+from mistral_common.protocol.instruct.normalize import normalizer_for_tokenizer_version
+from mistral_common.protocol.instruct.validator import ValidationMode, get_validator
 from mistral_common.protocol.instruct.tool_calls import (
     Function,
     Tool as MistralTool,
@@ -24,7 +26,8 @@ from mistral_common.protocol.instruct.tool_calls import (
     FunctionCall as MistralFunctionCall,
 )
 
-from src.prompt_builders.base_prompt_builder import BasePromptBuilder
+from src.prompt_builders.base_prompt_builder import BasePromptBuilder, ToolEntries
+from src.prompt_builders.config_loader import load_prompt_builders_yaml
 from src.prompt_builders.prompt_models import PromptPayload, PromptBuilderOutput
 from src.data_models.chat_completions import TextChatMessage, ToolCall, AssistantMessage
 from src.data_models.tools import Tool
@@ -32,6 +35,97 @@ from src.data_models.tools import Tool
 logger = logging.getLogger(__file__)
 
 
+@lru_cache(maxsize=8)
+def _get_mistral_tokenizer(model_name: str) -> MistralTokenizer:
+    """Load the tokenizer for a Mistral model, once per model name per process.
+
+    Loading reads the vocabulary from disk and builds its tables, which dominates
+    builder construction. Encoding does not change the tokenizer's state, so all
+    builders for the same model share one instance.
+
+    Args:
+        model_name (str): Name of the Mistral model.
+
+    Returns:
+        MistralTokenizer: The shared tokenizer for `model_name`.
+    """
+    return MistralTokenizer.from_model(model_name)
+
+
+@lru_cache(maxsize=32)
+def _mistral_tools_json(tool_entries: ToolEntries) -> str:
+    """Serialize tools as the compact JSON list embedded in chat messages.
+
+    Args:
+        tool_entries (ToolEntries): Tool key from `BasePromptBuilder._tool_entries`.
+
+    Returns:
+        str: JSON array of OpenAI-style function tool definitions.
+    """
+    formatted_tools = [
+        {
+            "type": "function",
+            "function": {
+                "name": name,
+                "description": description,
+                "parameters": json.loads(params_json)
+            }
+        }
+        for name, description, params_json in tool_entries
+    ]
+    return json.dumps(formatted_tools, separators=(',', ':'))
+
+
+@lru_cache(maxsize=32)
+def _mistral_tools(tool_entries: ToolEntries) -> Tuple[MistralTool, ...]:
+    """Convert tools to mistral_common tools, once per distinct tool set.
+
+    Args:
+        tool_entries (ToolEntries): Tool key from `BasePromptBuilder._tool_entries`.
+
+    Returns:
+        Tuple[MistralTool, ...]: The converted tools, in order.
+    """
+    return tuple(
+        MistralTool(function=Function(
+            name=name,
+            description=description,
+            parameters=json.loads(params_json),
+        ))
+        for name, description, params_json in tool_entries
+    )
+
+
+# Rendered prompts keyed by (model name, tool key, digest of the Mistral messages), most
+# recently used last. Only exact matches are reused: mistral_common places the system
+# prompt and tools relative to the last user message, so a shared prefix of two
+# conversations does not render to a shared prefix of their prompts.
+_PROMPT_TEXT_CACHE_SIZE = 256
+_prompt_text_cache: "OrderedDict[tuple, str]" = OrderedDict()
+
+
+def _prompt_cache_key(model_name: str, mistral_messages: List, tool_entries: ToolEntries) -> tuple:
+    """Build the `_prompt_text_cache` key for a chat completion request.
+
+    Args:
+        model_name (str): Name of the Mistral model the prompt is rendered for.
+        mistral_messages (List): Conversation converted to mistral_common messages.
+        tool_entries (ToolEntries): Tool key from `BasePromptBuilder._tool_entries`.
+
+    Returns:
+        tuple: The model name, the tool key and a digest of the serialized messages.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for message in mistral_messages:
+        digest.update(message.model_dump_json().encode())
+        digest.update(b"\x00")
+    return model_name, tool_entries, digest.digest()
+
+
+# Number of validated tool sets each builder remembers (see `_encode_messages`)
+_VALIDATED_TOOL_SETS_SIZE = 32
+
+
 class WatsonXMistralPromptBuilder(BasePromptBuilder):
     """Prompt builder for the Mistral model architecture.
 
@@ -44,19 +138,34 @@ class WatsonXMistralPromptBuilder(BasePromptBuilder):
         model_name (str): Name of the Mistral model to use.
         tokenizer (MistralTokenizer): Tokenizer instance for the specified model.
     """
-    def __init__(self, model_name: str = 'mistral-large'):
+    def __init__(self, model_name: str = 'mistral-large', use_encode_chat_completion: bool = False):
         """Initialize the Mistral prompt builder.
 
         Args:
             model_name (str): Name of the Mistral model to use.
                 Defaults to 'mistral-large'.
+            use_encode_chat_completion (bool): Render prompts with the tokenizer's
+                `encode_chat_completion`, which validates the whole request on every
+                call, instead of the equivalent `_encode_messages`. Intended for
+                checking the two produce the same prompts.
         """
         super().__init__()
         self.config = self._load_config()
+        system_prompt = self.config['system_prompt']
+        self._header_template = system_prompt['header']
+        self._tool_instructions = system_prompt['tool_instructions']
         self.model_name = model_name
-        self.tokenizer = MistralTokenizer.from_model(model_name)
-
-    async def build_chat(self, payload: PromptPayload) -> PromptBuilderOutput:
+        self.tokenizer = _get_mistral_tokenizer(model_name)
+        self.use_encode_chat_completion = use_encode_chat_completion
+        # The validation and normalization steps of encode_chat_completion, built the
+        # same way MistralTokenizer.from_model builds them, for _encode_messages
+        version = self.tokenizer.instruct_tokenizer.tokenizer.version
+        self._request_validator = get_validator(version, ValidationMode.test)
+        self._request_normalizer = normalizer_for_tokenizer_version(version)
+        # Tool keys whose tools passed validation, most recently used last
+        self._validated_tool_sets: "OrderedDict[ToolEntries, None]" = OrderedDict()
+
+    def build_chat_sync(self, payload: PromptPayload) -> PromptBuilderOutput:
         """Build chat messages with tools in the last assistant message.
 
         Modifies the conversation history to include tool definitions in the
@@ -77,24 +186,25 @@ class WatsonXMistralPromptBuilder(BasePromptBuilder):
             return PromptBuilderOutput(chat_messages=conversation_history)
 
         tool_info = self._format_tool_definitions(tool_definitions)
-        modified_history = conversation_history.copy()
 
-        last_assistant_idx = None
-        for idx, msg in enumerate(modified_history):
-            if msg.role == 'assistant':
-                last_assistant_idx = idx
+        # Scan backwards so only the messages after the last assistant reply are visited
+        last_assistant_idx = next(
+            (idx for idx in range(len(conversation_history) - 1, -1, -1)
+             if conversation_history[idx].role == 'assistant'),
+            None
+        )
 
         if last_assistant_idx is not None:
             # Add tool info to the last assistant message
-            last_assistant = modified_history[last_assistant_idx]
-            existing_content = last_assistant.content or ""
-            modified_history[last_assistant_idx] = AssistantMessage(
-                content=f"{existing_content}\n{tool_info}",
-            )
+            existing_content = conversation_history[last_assistant_idx].content or ""
+            modified_history = [
+                *conversation_history[:last_assistant_idx],
+                AssistantMessage(content=f"{existing_content}\n{tool_info}"),
+                *conversation_history[last_assistant_idx + 1:]
+            ]
         else:
             # Create new assistant message with tool info if none exists
-            assistant_msg = AssistantMessage(content=tool_info)
-            modified_history.append(assistant_msg)
+            modified_history = [*conversation_history, AssistantMessage(content=tool_info)]
 
         return PromptBuilderOutput(chat_messages=modified_history)
 
@@ -117,43 +227,76 @@ class WatsonXMistralPromptBuilder(BasePromptBuilder):
         # Convert messages to Mistral format
         mistral_messages = self._process_conversation_history(conversation_history)
 
+        # Identical requests (e.g. retries, or the same first turn) reuse the rendered prompt
+        tool_entries = self._tool_entries(tool_definitions)
+        cache_key = _prompt_cache_key(self.model_name, mistral_messages, tool_entries)
+        text_prompt = _prompt_text_cache.get(cache_key)
+        if text_prompt is not None:
+            _prompt_text_cache.move_to_end(cache_key)
+            return PromptBuilderOutput(text_prompt=text_prompt)
+
         # Convert tool definitions to Mistral format
-        mistral_tools = self._process_tool_definitions(tool_definitions)
+        mistral_tools = list(_mistral_tools(tool_entries))
 
-        chat_request = ChatCompletionRequest(
+        # Tokenize and get prompt text
+        if self.use_encode_chat_completion:
+            chat_request = ChatCompletionRequest(
+                tools=mistral_tools,
+                messages=mistral_messages,
+                model=self.model_name,
+            )
+            tokenized = self.tokenizer.encode_chat_completion(chat_request)
+        else:
+            tokenized = self._encode_messages(mistral_messages, mistral_tools, tool_entries)
+        _prompt_text_cache[cache_key] = tokenized.text
+        if len(_prompt_text_cache) > _PROMPT_TEXT_CACHE_SIZE:
+            _prompt_text_cache.popitem(last=False)
+        return PromptBuilderOutput(text_prompt=tokenized.text)
+
+    def _encode_messages(self, mistral_messages: List, mistral_tools: List[MistralTool],
+                         tool_entries: ToolEntries):
+        """Encode Mistral messages and tools like `self.tokenizer.encode_chat_completion`.
+
+        The messages and tools are already mistral_common models, so the request is
+        assembled without validating them again. Messages are checked on every call,
+        but a tool set's schemas are only checked the first time it is seen; failures
+        are not remembered and raise on every call.
+
+        Args:
+            mistral_messages (List): Conversation converted to mistral_common messages.
+            mistral_tools (List[MistralTool]): Tools converted to mistral_common tools.
+            tool_entries (ToolEntries): Tool key for `mistral_tools`.
+
+        Returns:
+            The tokenized request, as returned by `encode_chat_completion`.
+        """
+        chat_request = ChatCompletionRequest.model_construct(
             tools=mistral_tools,
             messages=mistral_messages,
             model=self.model_name,
         )
-
-        # Tokenize and get prompt text
-        tokenized = self.tokenizer.encode_chat_completion(chat_request)
-        return PromptBuilderOutput(text_prompt=tokenized.text)
+        if tool_entries in self._validated_tool_sets:
+            self._validated_tool_sets.move_to_end(tool_entries)
+            self._request_validator.validate_messages(
+                mistral_messages, continue_final_message=chat_request.continue_final_message
+            )
+        else:
+            self._request_validator.validate_request(chat_request)
+            self._validated_tool_sets[tool_entries] = None
+            if len(self._validated_tool_sets) > _VALIDATED_TOOL_SETS_SIZE:
+                self._validated_tool_sets.popitem(last=False)
+        instruct_request = self._request_normalizer.from_chat_completion_request(chat_request)
+        return self.tokenizer.instruct_tokenizer.encode_instruct(instruct_request)
 
     def _format_tool_definitions(self, tool_definitions: List[Tool]) -> str:
         """Format tool definitions in Mistral's required format."""
-        formatted_tools = []
-
-        for tool in tool_definitions:
-            tool_dict = {
-                "type": "function",
-                "function": {
-                    "name": tool.function.name,
-                    "description": tool.function.description,
-                    "parameters": tool.function.parameters.model_dump()
-                }
-            }
-            formatted_tools.append(tool_dict)
-
         # Create the final string with the required format
-        tool_names = [tool.function.name for tool in tool_definitions]
-        tool_section_header = self.config['system_prompt']['header'].format(
-            tools=", ".join(tool_names),
-            date=datetime.now().strftime('%Y-%m-%d')
+        tool_section_header = self._header_template.format(
+            tools=", ".join(tool.function.name for tool in tool_definitions),
+            date=self._current_date()
         )
-        tool_instructions = self.config['system_prompt']['tool_instructions']
-        tool_json = json.dumps(formatted_tools, separators=(',', ':'))
-        return f"[AVAILABLE_TOOLS]{tool_section_header}\n\n{tool_json}\n\n{tool_instructions}[/AVAILABLE_TOOLS]"
+        tool_json = _mistral_tools_json(self._tool_entries(tool_definitions))
+        return f"[AVAILABLE_TOOLS]{tool_section_header}\n\n{tool_json}\n\n{self._tool_instructions}[/AVAILABLE_TOOLS]"
 
     def _process_conversation_history(self, conversation_history: List[TextChatMessage]) -> List:
         """Convert conversation history to Mistral's message format."""
@@ -215,14 +358,7 @@ class WatsonXMistralPromptBuilder(BasePromptBuilder):
 
     def _process_tool_definitions(self, tool_definitions: List[Tool]) -> List[MistralTool]:
         """Convert tool definitions to Mistral's Tool format."""
-        return [
-            MistralTool(function=Function(
-                name=tool.function.name,
-                description=tool.function.description,
-                parameters=tool.function.parameters.model_dump(),
-            ))
-            for tool in tool_definitions
-        ]
+        return list(_mistral_tools(self._tool_entries(tool_definitions)))
 
     def _create_tool_call(self, tool_call_data: ToolCall) -> MistralToolCall:
         """Convert tool call data to Mistral's format."""
@@ -246,7 +382,4 @@ class WatsonXMistralPromptBuilder(BasePromptBuilder):
     @staticmethod
     def _load_config() -> Dict:
         """Load Mistral-specific configuration from YAML file."""
-        config_path = Path("src/configs/prompt_builders.yaml")
-        with config_path.open() as f:
-            config = yaml.safe_load(f)
-            return config.get('watsonx-mistral')
+        return load_prompt_builders_yaml().get('watsonx-mistral')
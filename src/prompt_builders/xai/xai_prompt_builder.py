@@ -1,16 +1,51 @@
 # src/prompt_builders/xai/xai_prompt_builder.py
 
-import yaml
+import json
 import logging
-from pathlib import Path
+from functools import lru_cache
 from typing import Dict, List
-from datetime import datetime
 
 from src.prompt_builders import BasePromptBuilder
+from src.prompt_builders.base_prompt_builder import ToolEntries
+from src.prompt_builders.config_loader import load_prompt_builders_yaml
 from src.data_models.chat_completions import SystemMessage
 from src.prompt_builders.prompt_models import PromptPayload, PromptBuilderOutput
 
 
+@lru_cache(maxsize=32)
+def _format_tool_descriptions(tool_entries: ToolEntries) -> str:
+    """Format the markdown tool descriptions, once per distinct tool set.
+
+    Args:
+        tool_entries (ToolEntries): Tool key from `BasePromptBuilder._tool_entries`.
+
+    Returns:
+        str: One `### name` section per tool, separated by blank lines.
+    """
+    tool_descriptions = []
+
+    for name, description, params_json in tool_entries:
+        description = description or "No description available"
+        parameters = json.loads(params_json) if params_json else {}
+
+        # Format parameter information
+        param_info = ""
+        if parameters and "properties" in parameters:
+            properties = parameters["properties"]
+            required = parameters.get("required") or []
+            param_lines = [
+                f"- {param_name} {'(required)' if param_name in required else '(optional)'}: "
+                f"{param_details.get('description', 'No description')} "
+                f"(Type: {param_details.get('type', 'any')})\n"
+                for param_name, param_details in properties.items()
+            ]
+            param_info = "\nParameters:\n" + "".join(param_lines)
+
+        tool_descriptions.append(f"### {name}\n{description}\n{param_info}")
+
+    return "\n\n".join(tool_descriptions)
+
+
 class XAIPromptBuilder(BasePromptBuilder):
     """A prompt builder specialized for xAI's chat completion models.
 
@@ -37,18 +72,22 @@ class XAIPromptBuilder(BasePromptBuilder):
         ```
     """
 
+    logger = logging.getLogger(__qualname__)
+
     def __init__(self):
         """Initialize the xAI prompt builder.
 
         Loads configuration from the prompt_builders.yaml file and sets up logging.
         Raises FileNotFoundError if the config file is not found.
         """
-        self.logger = logging.getLogger(self.__class__.__name__)
         self.logger.debug("Initializing XAIPromptBuilder")
         super().__init__()
         self.config = self._load_config()
+        system_prompt = self.config['system_prompt']
+        self._header_template = system_prompt['header']
+        self._tool_instructions = system_prompt['tool_instructions']
 
-    async def build_chat(self, payload: PromptPayload) -> PromptBuilderOutput:
+    def build_chat_sync(self, payload: PromptPayload) -> PromptBuilderOutput:
         """Build a chat completion prompt with optional tool definitions.
 
         Constructs a prompt by potentially modifying the conversation history to
@@ -75,29 +114,25 @@ class XAIPromptBuilder(BasePromptBuilder):
             self.logger.debug("No tool definitions provided, returning original history")
             return PromptBuilderOutput(chat_messages=conversation_history)
 
-        tool_names = [tool.function.name for tool in tool_definitions]
-
-        tool_section_header = self.config['system_prompt']['header'].format(
-            tools=", ".join(tool_names),
-            date=datetime.now().strftime('%Y-%m-%d')
+        tool_section_header = self._header_template.format(
+            tools=", ".join(tool.function.name for tool in tool_definitions),
+            date=self._current_date()
         )
-        tool_instructions = self.config['system_prompt']['tool_instructions']
-        tool_info = await self._build_system_content(tool_definitions, tool_section_header, tool_instructions)
-        modified_history = conversation_history.copy()
+        tool_info = self._build_system_content_sync(tool_definitions, tool_section_header, self._tool_instructions)
 
-        if conversation_history and isinstance(conversation_history[0], SystemMessage):
+        if conversation_history and conversation_history[0].role == 'system':
             existing_content = conversation_history[0].content
-            modified_history[0] = SystemMessage(
-                content=f"{existing_content}\n\n## Tools Available:\n\n{tool_info}\n\n"
-            )
+            modified_history = [
+                SystemMessage(content=f"{existing_content}\n\n## Tools Available:\n\n{tool_info}\n\n"),
+                *conversation_history[1:]
+            ]
         else:
-            system_msg = SystemMessage(content=f"## Tools Available:\n\n{tool_info}")
-            modified_history.insert(0, system_msg)
+            modified_history = [SystemMessage(content=f"## Tools Available:\n\n{tool_info}"), *conversation_history]
 
         self.logger.debug("Returning modified history with %d messages", len(modified_history))
         return PromptBuilderOutput(chat_messages=modified_history)
 
-    async def _build_system_content(self, tool_definitions, header, instructions):
+    def _build_system_content_sync(self, tool_definitions, header, instructions):
         """Build the system content that includes tool definitions.
 
         Args:
@@ -108,30 +143,7 @@ class XAIPromptBuilder(BasePromptBuilder):
         Returns:
             str: Formatted system content with tool information
         """
-        tool_descriptions = []
-
-        for tool in tool_definitions:
-            function = tool.function
-            name = function.name
-            description = function.description or "No description available"
-            parameters = function.parameters.model_dump() if function.parameters else {}
-
-            # Format parameter information
-            param_info = ""
-            if parameters and "properties" in parameters:
-                properties = parameters["properties"]
-                required = parameters.get("required", [])
-                param_info = "\nParameters:\n"
-
-                for param_name, param_details in properties.items():
-                    req_status = "(required)" if param_name in required else "(optional)"
-                    param_desc = param_details.get("description", "No description")
-                    param_type = param_details.get("type", "any")
-                    param_info += f"- {param_name} {req_status}: {param_desc} (Type: {param_type})\n"
-
-            tool_descriptions.append(f"### {name}\n{description}\n{param_info}")
-
-        formatted_tools = "\n\n".join(tool_descriptions)
+        formatted_tools = _format_tool_descriptions(self._tool_entries(tool_definitions))
         return f"{header}\n\n{formatted_tools}\n\n{instructions}"
 
     async def build_text(self, context: Dict) -> str:
@@ -158,7 +170,4 @@ class XAIPromptBuilder(BasePromptBuilder):
             FileNotFoundError: If the config file doesn't exist.
             yaml.YAMLError: If the config file is malformed.
         """
-        config_path = Path("src/configs/prompt_builders.yaml")
-        with config_path.open() as f:
-            config = yaml.safe_load(f)
-            return config.get('xai', {})
+        return load_prompt_builders_yaml().get('xai', {})
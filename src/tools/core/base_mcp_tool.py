@@ -20,6 +20,8 @@ class BaseMCPTool(BaseTool, ABC):
     Subclasses must implement the execute and parse_output methods.
     """
 
+    __slots__ = ("mcp_tool_def",)
+
     def __init__(self, mcp_tool_def: MCPToolDefinition, config: Optional[Dict] = None):
         super().__init__(config=config)
         self.mcp_tool_def = mcp_tool_def
@@ -1,8 +1,10 @@
 # src/tools/core/base_rest_tool.py
 
 import os
+import copy
 import json
 import time
+import hashlib
 import aiohttp
 import logging
 import traceback
@@ -10,7 +12,8 @@ from enum import Enum
 from abc import abstractmethod
 from dotenv import load_dotenv
 from asyncio import Lock, sleep
-from typing import Optional, Dict, Any, Union, List
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Union, List, Tuple
 
 from src.tools.core.base_tool import BaseTool
 from src.data_models.agent import StreamContext
@@ -37,11 +40,34 @@ class ResponseFormat(Enum):
     BINARY = "binary"
 
 
+# Coroutine functions reading a response body in each supported format
+_RESPONSE_READERS = {
+    ResponseFormat.JSON.value: aiohttp.ClientResponse.json,
+    ResponseFormat.TEXT.value: aiohttp.ClientResponse.text,
+    ResponseFormat.BINARY.value: aiohttp.ClientResponse.read,
+}
+
+# Error messages for client error statuses that are returned without retrying;
+# `{body}` is replaced with the response text
+_STATUS_ERRORS = {
+    400: "Bad Request: {body}",
+    401: "Unauthorized access - check API key or token.",
+    403: "Forbidden - insufficient permissions.",
+    404: "Resource not found - verify endpoint URL.",
+}
+
+
 class BaseRESTTool(BaseTool):
+    logger = logging.getLogger(__qualname__)
+
+    def __init_subclass__(cls, **kwargs):
+        """Give each tool class its own logger, named after the class, once at definition time."""
+        super().__init_subclass__(**kwargs)
+        cls.logger = logging.getLogger(cls.__name__)
+
     def __init__(self, config: Optional[Dict] = None):
         super().__init__()
         self.config = config or {}
-        self.logger = logging.getLogger(self.__class__.__name__)
 
         # Base configuration
         self.endpoint: str = self.config.get("endpoint_url")
@@ -52,34 +78,52 @@ class BaseRESTTool(BaseTool):
         # Additional OpenAI tool configuration
         self.strict = self.config.get("strict", False)
 
+        # Headers sent with every request; make_request copies this and adds per-request headers
+        self._base_headers: Dict[str, str] = {
+            "Content-Type": self.config.get("content_type", "application/json"),
+            "Cache-Control": "no-cache"
+        }
+
         # Enhanced configuration (keep existing config...)
-        self.content_type = self.config.get("content_type", "application/json")
         self.rate_limit = self.config.get("rate_limit", 0)
         self.default_timeout = self.config.get("default_timeout", 30)
         self.max_retries = self.config.get("max_retries", 3)
         self.retry_delay = self.config.get("retry_delay", 1.0)
+        self.cache_ttl = self.config.get("cache_ttl", 0)
+        self.cache_max_entries = self.config.get("cache_max_entries", 1024)
+
+        # Successful GET results keyed by _get_cache_key: (expiry on the monotonic clock, result),
+        # least recently used first. Only populated when cache_ttl > 0.
+        self._response_cache: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
 
-        # Initialize rate limiting
-        self._request_lock = Lock()
-        self._last_request_time = 0
+        # Initialize rate limiting: monotonic time at which the bucket would next be empty
+        self._rate_limit_tat = 0.0
+
+        # HTTP session shared by all requests, so connections, DNS lookups and TLS
+        # sessions are reused; created on first use because it needs a running loop
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_lock = Lock()
 
         # Validate required configuration
         if not self.endpoint:
             raise ValueError("The 'endpoint_url' is required in the configuration.")
 
-        # Setup authentication
-        api_key = os.getenv(self.api_key_env) if self.api_key_env else None
+        # Setup authentication; credentials are read from the environment once here
+        self._api_key = os.getenv(self.api_key_env) if self.api_key_env else None
         client_secret = os.getenv(self.client_secret_env) if self.client_secret_env else None
 
-        if self.token_url and api_key and client_secret:
+        if self.token_url and self._api_key and client_secret:
             self.token_manager = OAuth2ClientCredentialsManager(
-                api_key=api_key,
+                api_key=self._api_key,
                 client_secret_base64=client_secret,
                 token_url=self.token_url
             )
         else:
             self.token_manager = None
 
+        if self._api_key:
+            self._base_headers["apikey"] = self._api_key
+
         # Initialize middleware hooks
         self._request_middleware: List[callable] = []
         self._response_middleware: List[callable] = []
@@ -93,6 +137,15 @@ class BaseRESTTool(BaseTool):
                 "additionalProperties": False
             }
 
+    @property
+    def content_type(self) -> str:
+        """Content-Type header sent with every request."""
+        return self._base_headers["Content-Type"]
+
+    @content_type.setter
+    def content_type(self, value: str):
+        self._base_headers["Content-Type"] = value
+
     def add_request_middleware(self, middleware: callable):
         """Add middleware function to modify requests before sending.
 
@@ -121,19 +174,97 @@ class BaseRESTTool(BaseTool):
             response_data = await middleware(response_data)
         return response_data
 
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the tool's shared HTTP session, creating it on first use.
+
+        Returns:
+            aiohttp.ClientSession: An open session with a pooled connector.
+        """
+        if self._session is None or self._session.closed:
+            async with self._session_lock:
+                if self._session is None or self._session.closed:
+                    self._session = aiohttp.ClientSession(
+                        connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300)
+                    )
+        return self._session
+
+    async def close(self):
+        """Close the shared HTTP session and its pooled connections.
+
+        The tool stays usable; a new session is created on the next request.
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
     async def _enforce_rate_limit(self):
-        """Enforce the configured rate limit."""
+        """Enforce the configured rate limit with a token bucket.
+
+        Up to `rate_limit` requests (at least one) may start at once; after that,
+        requests are spaced `1 / rate_limit` seconds apart. Each caller reserves its
+        start time without holding a lock, so concurrent requests only wait for
+        their own slot instead of queueing behind each other's sleeps.
+        """
         if self.rate_limit > 0:
-            async with self._request_lock:
-                current_time = time.time()
-                elapsed = current_time - self._last_request_time
-                if elapsed < 1.0 / self.rate_limit:
-                    await sleep(1.0 / self.rate_limit - elapsed)
-                self._last_request_time = time.time()
+            interval = 1.0 / self.rate_limit
+            burst_tolerance = (max(1, int(self.rate_limit)) - 1) * interval
+            now = time.monotonic()
+            tat = max(self._rate_limit_tat, now)
+            self._rate_limit_tat = tat + interval
+            delay = tat - burst_tolerance - now
+            if delay > 0:
+                await sleep(delay)
 
     def _get_cache_key(self, method: str, endpoint_url: str, params: Optional[Dict], data: Optional[Dict]) -> str:
-        """Generate a cache key for the request."""
-        return f"{method}:{endpoint_url}:{hash(frozenset(params.items() if params else ()))}:{hash(frozenset(data.items() if data else ()))}"
+        """Generate a cache key for the request.
+
+        The key is a digest of the canonical JSON of the request, so it handles nested
+        params and body values and is the same in every process.
+
+        Args:
+            method (str): HTTP method.
+            endpoint_url (str): Request URL.
+            params (Optional[Dict]): Query parameters.
+            data (Optional[Dict]): Request body data.
+
+        Returns:
+            str: Hex digest identifying the request.
+        """
+        canonical = json.dumps([method, endpoint_url, params or {}, data or {}], sort_keys=True, default=str)
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def _get_cached_response(self, cache_key: str) -> Tuple[bool, Any]:
+        """Look up an unexpired cached response.
+
+        Args:
+            cache_key (str): Key from `_get_cache_key`.
+
+        Returns:
+            Tuple[bool, Any]: Whether there was a hit, and a copy of the cached result
+                that the caller may modify.
+        """
+        entry = self._response_cache.get(cache_key)
+        if entry is None:
+            return False, None
+        if entry[0] <= time.monotonic():
+            del self._response_cache[cache_key]
+            return False, None
+        self._response_cache.move_to_end(cache_key)
+        return True, copy.deepcopy(entry[1])
+
+    def _cache_response(self, cache_key: str, result: Any):
+        """Store a response for `cache_ttl` seconds, evicting the least recently used entry when full.
+
+        A copy is stored, so later changes to `result` do not reach cached hits.
+
+        Args:
+            cache_key (str): Key from `_get_cache_key`.
+            result (Any): The response after response middleware.
+        """
+        self._response_cache[cache_key] = (time.monotonic() + self.cache_ttl, copy.deepcopy(result))
+        self._response_cache.move_to_end(cache_key)
+        if len(self._response_cache) > self.cache_max_entries:
+            self._response_cache.popitem(last=False)
 
     async def get_access_token(self) -> Optional[str]:
         """Retrieve access token for API authentication.
@@ -192,16 +323,12 @@ class BaseRESTTool(BaseTool):
             method = method.value
         if isinstance(response_format, ResponseFormat):
             response_format = response_format.value
+        read_response = _RESPONSE_READERS.get(response_format)
         endpoint_url = endpoint_url or self.endpoint
         timeout = timeout or self.default_timeout
 
         # Prepare headers
-        headers = {
-            "Content-Type": self.content_type,
-            "Cache-Control": "no-cache"
-        }
-        if self.api_key_env:
-            headers["apikey"] = os.getenv(self.api_key_env)
+        headers = self._base_headers.copy()
         if additional_headers:
             headers.update(additional_headers)
 
@@ -219,54 +346,58 @@ class BaseRESTTool(BaseTool):
             "timeout": timeout
         }
 
-        # Apply request middleware
-        request_data = await self._apply_request_middleware(request_data)
+        # Apply request middleware (skipped entirely in the common case of none registered)
+        if self._request_middleware:
+            request_data = await self._apply_request_middleware(request_data)
+
+        # Serve repeated GETs from the response cache when enabled
+        cache_key = None
+        if self.cache_ttl > 0 and request_data["method"] == HttpMethod.GET.value:
+            cache_key = response_format + ":" + self._get_cache_key(
+                request_data["method"], request_data["url"], request_data["params"], request_data["data"]
+            )
+            hit, cached = self._get_cached_response(cache_key)
+            if hit:
+                return cached
 
         # Enforce rate limit
         await self._enforce_rate_limit()
 
         # Make request with retry logic
+        session = await self._get_session()
         for attempt in range(self.max_retries):
             try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.request(**request_data) as response:
-                        # Handle response based on status code
-                        if response.status == 200:
-                            if response_format == ResponseFormat.JSON.value:
-                                try:
-                                    result = await response.json()
-                                except json.JSONDecodeError:
-                                    self.logger.error("Failed to decode JSON from response")
-                                    return {"error": "Invalid JSON response from server"}
-                            elif response_format == ResponseFormat.TEXT.value:
-                                result = await response.text()
-                            elif response_format == ResponseFormat.BINARY.value:
-                                result = await response.read()
-                            else:
-                                raise ValueError(f"Unsupported response format: {response_format}")
-
-                            # Apply response middleware
+                async with session.request(**request_data) as response:
+                    # Handle response based on status code
+                    if response.status == 200:
+                        if read_response is None:
+                            raise ValueError(f"Unsupported response format: {response_format}")
+                        try:
+                            result = await read_response(response)
+                        except json.JSONDecodeError:
+                            self.logger.error("Failed to decode JSON from response")
+                            return {"error": "Invalid JSON response from server"}
+
+                        # Apply response middleware
+                        if self._response_middleware:
                             result = await self._apply_response_middleware(result)
 
-                            return result
-
-                        # Handle error responses
-                        error_response = await response.text()
-                        if response.status == 400:
-                            return {"error": f"Bad Request: {error_response}"}
-                        elif response.status == 401:
-                            return {"error": "Unauthorized access - check API key or token."}
-                        elif response.status == 403:
-                            return {"error": "Forbidden - insufficient permissions."}
-                        elif response.status == 404:
-                            return {"error": "Resource not found - verify endpoint URL."}
-                        elif response.status >= 500:
-                            if attempt < self.max_retries - 1:
-                                await sleep(self.retry_delay * (2 ** attempt))  # Exponential backoff
-                                continue
-                            return {"error": "Server error - the API is currently unavailable."}
-                        else:
-                            return {"error": f"Unexpected status code {response.status}: {error_response}"}
+                        if cache_key is not None:
+                            self._cache_response(cache_key, result)
+                        return result
+
+                    # Handle error responses
+                    error_response = await response.text()
+                    error_template = _STATUS_ERRORS.get(response.status)
+                    if error_template is not None:
+                        return {"error": error_template.format(body=error_response)}
+                    elif response.status >= 500:
+                        if attempt < self.max_retries - 1:
+                            await sleep(self.retry_delay * (2 ** attempt))  # Exponential backoff
+                            continue
+                        return {"error": "Server error - the API is currently unavailable."}
+                    else:
+                        return {"error": f"Unexpected status code {response.status}: {error_response}"}
 
             except aiohttp.ClientError as e:
                 if attempt < self.max_retries - 1:
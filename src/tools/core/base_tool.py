@@ -1,6 +1,7 @@
 # src/tools/core/base_tool.py
 
-from typing import Optional, Dict
+import json
+from typing import Any, Optional, Dict, Tuple
 from abc import abstractmethod
 from src.data_models.tools import ToolResponse
 from src.data_models.agent import StreamContext
@@ -13,6 +14,9 @@ class BaseTool:
     Provides the foundation for tool implementation with standard interfaces
     for execution, definition retrieval, and output parsing.
     """
+    # Subclasses that don't declare __slots__ still get a __dict__ for their own attributes
+    __slots__ = ("name", "config", "description", "parameters", "strict", "_definition")
+
     name: str
 
     def __init__(self, config: Optional[Dict] = None):
@@ -20,6 +24,8 @@ class BaseTool:
         self.description = None
         self.parameters = {}
         self.strict = False
+        # (attributes the definition was built from, definition); see get_definition
+        self._definition: Optional[Tuple[Tuple[Any, ...], Tool]] = None
 
     @abstractmethod
     async def execute(self, context: Optional[StreamContext] = None, **kwargs) -> ToolResponse:
@@ -29,10 +35,22 @@ class BaseTool:
     def get_definition(self) -> Tool:
         """Get the tool's OpenAI-compatible definition.
 
+        The definition is built once and the same instance is returned on later
+        calls, so callers must not modify it. Subclasses usually set their
+        attributes after `__init__`, so it is rebuilt whenever `name`,
+        `description`, `strict` or the contents of `parameters` change.
+
         Returns:
             Tool: Tool definition including type, function details and parameters.
         """
-        return Tool(
+        # Serializing the parameters is much cheaper than building the Tool, and also
+        # catches changes made inside the dict
+        parameters_json = json.dumps(self.parameters, sort_keys=True, default=str)
+        key = (self.name, self.description, parameters_json, self.strict)
+        if self._definition is not None and self._definition[0] == key:
+            return self._definition[1]
+
+        definition = Tool(
             type="function",
             function=Function(
                 name=self.name,
@@ -46,6 +64,8 @@ class BaseTool:
                 strict=self.strict
             )
         )
+        self._definition = (key, definition)
+        return definition
 
     @abstractmethod
     def parse_output(self, output: str):
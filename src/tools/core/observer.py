@@ -1,9 +1,10 @@
 # src/tools/core/observer.py
 
 import asyncio
+import hashlib
 import logging
 from enum import Enum
-from typing import Callable, List, Any, Dict, Union, Coroutine
+from typing import Callable, List, Any, Dict, Optional, Set, Tuple, Union, Coroutine
 
 
 class ToolEventType(Enum):
@@ -19,6 +20,8 @@ class ToolUpdateEvent:
     Represents an event indicating changes to MCP tool definitions.
     """
 
+    __slots__ = ("event_type", "new_tool_defs", "removed_tool_names", "updated_tool_defs")
+
     def __init__(
             self,
             event_type: ToolEventType,
@@ -31,6 +34,13 @@ class ToolUpdateEvent:
         self.removed_tool_names = removed_tool_names or []
         self.updated_tool_defs = updated_tool_defs or []
 
+    def tool_names(self) -> Set[str]:
+        """Names of every tool this event adds, removes or updates."""
+        names = set(self.removed_tool_names)
+        names.update(tool.name for tool in self.new_tool_defs)
+        names.update(tool.name for tool in self.updated_tool_defs)
+        return names
+
     def __str__(self):
         return (
             f"ToolUpdateEvent(type={self.event_type.value}, "
@@ -43,55 +53,194 @@ class ToolUpdateEvent:
 # Type alias for observer callbacks
 ToolUpdateCallback = Callable[[ToolUpdateEvent], Union[None, Coroutine[Any, Any, None]]]
 
+# How long a tools/list_changed notification waits for a newer one before reloading the tool list
+TOOLS_LIST_CHANGED_DEBOUNCE_SECONDS = 0.05
+
+# Events waiting for delivery before notify() starts waiting for the queue to drain
+EVENT_QUEUE_SIZE = 1024
+
+
+def _merge_events(first: ToolUpdateEvent, second: ToolUpdateEvent) -> Optional[ToolUpdateEvent]:
+    """Combine two queued events into a single LIST_CHANGED event.
+
+    Subscribers apply additions, removals and updates in a fixed order rather than
+    in the order they happened, so events are only merged when they touch disjoint
+    sets of tools.
+
+    Args:
+        first (ToolUpdateEvent): The earlier event.
+        second (ToolUpdateEvent): The later event.
+
+    Returns:
+        Optional[ToolUpdateEvent]: The merged event, or None if the events share a tool
+            and must be delivered separately.
+    """
+    if not first.tool_names().isdisjoint(second.tool_names()):
+        return None
+    return ToolUpdateEvent(
+        ToolEventType.LIST_CHANGED,
+        new_tool_defs=first.new_tool_defs + second.new_tool_defs,
+        removed_tool_names=first.removed_tool_names + second.removed_tool_names,
+        updated_tool_defs=first.updated_tool_defs + second.updated_tool_defs,
+    )
+
 
 class ToolRegistryObserver:
     """
     Implements an observer pattern for tool registry updates.
 
     Subscribers can register callback functions that will be invoked when tool updates occur.
+
+    Subscribers are kept in an immutable tuple that is replaced, never mutated, when
+    the subscription list changes. `notify` iterates the tuple it started with, so
+    callbacks that subscribe or unsubscribe while it awaits do not affect the
+    notification in progress. A set alongside it makes membership checks O(1).
+
+    Delivery is asynchronous: `notify` only queues the event and a background task
+    passes it to subscribers, so the caller is not held up by subscriber work. Await
+    `drain` to wait until queued events have been delivered. Events that pile up
+    while a delivery is in progress are merged where possible and delivered together.
     """
 
+    __slots__ = ("_subscribers", "_subscriber_set", "_queue", "_worker_task")
+
+    logger = logging.getLogger(__qualname__)
+
+    def __init_subclass__(cls, **kwargs):
+        """Give each subclass its own logger, named after the class, once at definition time."""
+        super().__init_subclass__(**kwargs)
+        cls.logger = logging.getLogger(cls.__name__)
+
     def __init__(self):
-        self.logger = logging.getLogger(self.__class__.__name__)
-        self._subscribers: List[ToolUpdateCallback] = []
+        self._subscribers: Tuple[ToolUpdateCallback, ...] = ()
+        self._subscriber_set: Set[ToolUpdateCallback] = set()
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=EVENT_QUEUE_SIZE)
+        self._worker_task: Optional[asyncio.Task] = None
 
     def subscribe(self, callback: ToolUpdateCallback) -> None:
         """Subscribe to tool update events."""
-        if callback not in self._subscribers:
-            self._subscribers.append(callback)
-            self.logger.debug(f"Subscriber added. Total subscribers: {len(self._subscribers)}")
+        if callback not in self._subscriber_set:
+            self._subscriber_set.add(callback)
+            self._subscribers = self._subscribers + (callback,)
+            self.logger.debug("Subscriber added. Total subscribers: %d", len(self._subscribers))
 
     def unsubscribe(self, callback: ToolUpdateCallback) -> None:
         """Unsubscribe from tool update events."""
-        if callback in self._subscribers:
-            self._subscribers.remove(callback)
-            self.logger.debug(f"Subscriber removed. Total subscribers: {len(self._subscribers)}")
+        if callback in self._subscriber_set:
+            self._subscriber_set.discard(callback)
+            self._subscribers = tuple(cb for cb in self._subscribers if cb != callback)
+            self.logger.debug("Subscriber removed. Total subscribers: %d", len(self._subscribers))
 
     async def notify(self, event: ToolUpdateEvent) -> None:
         """
-        Notify all subscribers about a tool update event.
+        Queue a tool update event for delivery to all subscribers.
+
+        Returns as soon as the event is queued, usually before subscribers have
+        seen it; the background delivery task is started on first use. Only waits
+        if `EVENT_QUEUE_SIZE` events are already pending, so a stalled subscriber
+        slows producers down instead of events being dropped.
+        """
+        if self._worker_task is None or self._worker_task.done():
+            self._worker_task = asyncio.create_task(self._deliver_events())
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.logger.warning("Tool update queue is full; waiting for subscribers to catch up")
+            await self._queue.put(event)
+
+    async def drain(self) -> None:
+        """Wait until every event queued so far has been delivered to subscribers."""
+        await self._queue.join()
+
+    async def close(self) -> None:
+        """Stop the background delivery task, discarding any undelivered events."""
+        if self._worker_task is not None:
+            self._worker_task.cancel()
+            try:
+                await self._worker_task
+            except asyncio.CancelledError:
+                pass
+            self._worker_task = None
+        # Release any drain() callers waiting on the discarded events
+        while not self._queue.empty():
+            self._queue.get_nowait()
+            self._queue.task_done()
+
+    async def _deliver_events(self) -> None:
+        """Deliver queued events to subscribers until cancelled."""
+        while True:
+            event = await self._queue.get()
+            pending = [event]
+            taken = 1
+            try:
+                while not self._queue.empty():
+                    queued = self._queue.get_nowait()
+                    taken += 1
+                    merged = _merge_events(pending[-1], queued)
+                    if merged is None:
+                        pending.append(queued)
+                    else:
+                        pending[-1] = merged
+                for event in pending:
+                    await self._dispatch(event)
+            finally:
+                # Also on cancellation, so drain() never waits for events that were taken
+                for _ in range(taken):
+                    self._queue.task_done()
+
+    async def _dispatch(self, event: ToolUpdateEvent) -> None:
+        """
+        Deliver one event to all subscribers.
         Handles both synchronous and asynchronous callbacks.
+
+        Synchronous callbacks run as they are reached; the coroutines returned by
+        asynchronous ones are awaited together, so a slow subscriber does not delay
+        the others. A failing callback is logged and does not affect the rest.
         """
-        self.logger.debug(f"Notifying {len(self._subscribers)} subscribers about: {event}")
-        for callback in self._subscribers:
+        subscribers = self._subscribers
+        self.logger.debug("Notifying %d subscribers about: %s", len(subscribers), event)
+        pending = []
+        for callback in subscribers:
             try:
                 result = callback(event)
                 if asyncio.iscoroutine(result):
-                    await result
+                    pending.append(result)
             except Exception as e:
-                self.logger.error(f"Error in subscriber callback: {e}", exc_info=True)
+                self.logger.error("Error in subscriber callback: %s", e, exc_info=True)
+
+        if pending:
+            results = await asyncio.gather(*pending, return_exceptions=True)
+            for result in results:
+                if isinstance(result, Exception):
+                    self.logger.error("Error in subscriber callback: %s", result, exc_info=result)
 
 
 class MCPToolObserver:
     """
     Connects MCP notifications to the ToolRegistryObserver.
     This class bridges between MCP client notifications and the tool registry.
+
+    Bursts of list_changed notifications are debounced: each one waits
+    `debounce_seconds` and only the last of a burst fetches and diffs the tool list.
     """
 
-    def __init__(self):
-        self.logger = logging.getLogger(self.__class__.__name__)
+    __slots__ = ("observer", "_current_tools", "_debounce_seconds", "_notification_count", "_reload_lock")
+
+    logger = logging.getLogger(__qualname__)
+
+    def __init_subclass__(cls, **kwargs):
+        """Give each subclass its own logger, named after the class, once at definition time."""
+        super().__init_subclass__(**kwargs)
+        cls.logger = logging.getLogger(cls.__name__)
+
+    def __init__(self, debounce_seconds: float = TOOLS_LIST_CHANGED_DEBOUNCE_SECONDS):
         self.observer = ToolRegistryObserver()
-        self._current_tools: Dict[str, Any] = {}
+        # Tool name -> (digest of its definition, definition) from the last reload
+        self._current_tools: Dict[str, Tuple[bytes, Any]] = {}
+        self._debounce_seconds = debounce_seconds
+        # Incremented per notification so a waiting handler can tell it has been superseded
+        self._notification_count = 0
+        self._reload_lock = asyncio.Lock()
 
     def register_with_mcp_client(self, mcp_client):
         """
@@ -103,9 +252,33 @@ class MCPToolObserver:
         )
         self.logger.info("Registered with MCP client for tool notifications")
 
+    async def drain(self) -> None:
+        """Wait until every tool update event queued so far has been delivered."""
+        await self.observer.drain()
+
+    async def close(self) -> None:
+        """Stop delivering tool update events to subscribers."""
+        await self.observer.close()
+
     async def _handle_tools_list_changed(self, notification):
         """
         Handle notifications when the MCP tool list changes.
+        Reloads the tool list unless a newer notification arrives within the debounce delay.
+        """
+        self._notification_count += 1
+        notification_number = self._notification_count
+        await asyncio.sleep(self._debounce_seconds)
+        if notification_number != self._notification_count:
+            self.logger.debug("Skipping tool list reload superseded by a newer notification")
+            return
+
+        # Reloads that still overlap run one at a time so each diffs against the previous result
+        async with self._reload_lock:
+            await self._reload_tools(notification)
+
+    async def _reload_tools(self, notification):
+        """
+        Fetch the current MCP tool list and notify subscribers of changes.
         This compares the current and new tool list to determine what changed.
         """
         try:
@@ -114,20 +287,23 @@ class MCPToolObserver:
                 self.logger.warning("Received empty tool list from MCP")
                 return
 
-            new_tools_map = {tool.name: tool for tool in mcp_tools_result.tools}
+            new_tools_map = {tool.name: (self._tool_digest(tool), tool) for tool in mcp_tools_result.tools}
 
-            # Identify added, removed, and updated tools
-            added_tools = []
-            updated_tools = []
-            for name, tool in new_tools_map.items():
-                if name not in self._current_tools:
-                    added_tools.append(tool)
-                elif self._tools_differ(self._current_tools[name], tool):
-                    updated_tools.append(tool)
+            # Identify added, removed, and updated tools. Names are diffed as sets; the
+            # lists are then built in server order so tool registration stays deterministic.
+            current_tools = self._current_tools
+            added_names = new_tools_map.keys() - current_tools.keys()
+            removed_names = current_tools.keys() - new_tools_map.keys()
 
+            added_tools = [
+                tool for name, (_, tool) in new_tools_map.items() if name in added_names
+            ] if added_names else []
             removed_tools = [
-                name for name in self._current_tools.keys()
-                if name not in new_tools_map
+                name for name in current_tools if name in removed_names
+            ] if removed_names else []
+            updated_tools = [
+                tool for name, (digest, tool) in new_tools_map.items()
+                if name not in added_names and self._tools_differ(current_tools[name][0], digest)
             ]
 
             self._current_tools = new_tools_map
@@ -149,17 +325,25 @@ class MCPToolObserver:
                 )
 
             self.logger.info(
-                f"Tool changes detected: +{len(added_tools)}, -{len(removed_tools)}, "
-                f"~{len(updated_tools)}"
+                "Tool changes detected: +%d, -%d, ~%d",
+                len(added_tools), len(removed_tools), len(updated_tools)
             )
             await self.observer.notify(event)
 
         except Exception as e:
-            self.logger.error(f"Error handling tools list changed: {e}", exc_info=True)
+            self.logger.error("Error handling tools list changed: %s", e, exc_info=True)
+
+    @staticmethod
+    def _tool_digest(tool) -> bytes:
+        """
+        Compute a compact digest of a tool definition for change detection.
+        Each definition is serialized once when it is received; later comparisons
+        against it only compare digests instead of walking the whole input schema.
+        """
+        return hashlib.blake2b(tool.model_dump_json().encode(), digest_size=16).digest()
 
-    def _tools_differ(self, old_tool, new_tool) -> bool:
+    def _tools_differ(self, old_digest: bytes, new_digest: bytes) -> bool:
         """
-        Compare two tool definitions to determine if they differ substantially.
-        This is a simple implementation - enhance based on your tool definition structure.
+        Compare the digests of two tool definitions to determine if they differ.
         """
-        return old_tool != new_tool
+        return old_digest != new_digest
@@ -6,6 +6,9 @@ from abc import ABC, abstractmethod
 
 
 class BaseToolCallParser(ABC):
+    # Subclasses that don't declare __slots__ still get a __dict__ for their own attributes
+    __slots__ = ("config", "logger")
+
     def __init__(self, config: Dict[str, Any]):
         """Abstract base class for parsing tool calls from text.
 
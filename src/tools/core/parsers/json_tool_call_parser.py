@@ -1,11 +1,49 @@
 # src/tools/core/parsers/json_tool_call_parser.py
 
 import re
+import json
 import json5
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator, List, Tuple
 
 from src.tools.core.parsers.base_tool_call_parser import BaseToolCallParser
 
+# Characters that can change the scanner state in JSONToolCallParser.iter_json_spans,
+# for str input and for the ASCII bytes it scans instead when possible
+_DELIM_RE = re.compile(r'[{}\[\]"\\]')
+_DELIM_BYTES_RE = re.compile(rb'[{}\[\]"\\]')
+
+
+# Keys of a plain tool call, whose name is never parsed as nested JSON
+_TOOL_CALL_KEYS = frozenset(("name", "arguments"))
+
+# Common LLM JSON errors, fixed in a single pass by _repair_match:
+# - "string": a double- or single-quoted string literal, matched first so its
+#   contents are skipped and returned unchanged
+# - "close": a missing comma, or a semicolon instead of a comma, between objects/arrays
+# - unnamed: a trailing comma before a closing brace/bracket
+# - "open"/"key": an unquoted property name
+_REPAIR_RE = re.compile(
+    r'(?P<string>"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\')'
+    r'|(?P<close>[}\]])\s*;?\s*(?=[{\[])'
+    r'|,\s*(?=[}\]])'
+    r'|(?P<open>[{,])\s*(?P<key>[a-zA-Z_][a-zA-Z0-9_]*)\s*:',
+    re.DOTALL,
+)
+
+
+def _repair_match(match: "re.Match[str]") -> str:
+    """Return the replacement for one `_REPAIR_RE` match."""
+    string = match.group('string')
+    if string is not None:
+        return string
+    close = match.group('close')
+    if close is not None:
+        return close + ','
+    opener = match.group('open')
+    if opener is not None:
+        return f'{opener}"{match.group("key")}":'
+    return ''
+
 
 class JSONToolCallParser(BaseToolCallParser):
     """Enhanced parser for extracting and processing JSON tool calls from raw text.
@@ -18,12 +56,12 @@ class JSONToolCallParser(BaseToolCallParser):
     - Single quotes instead of double quotes
     - Trailing commas
     - Other common JSON syntax errors
+
+    Set `max_tool_calls` in the parser config to stop scanning once that many
+    tool calls have been parsed; by default every candidate is parsed.
     """
-    # Precompiled regex patterns for common JSON errors
-    SEMICOLON_PATTERN = re.compile(r'(\}|\])\s*;\s*(\{|\[)')
-    TRAILING_COMMA_PATTERN = re.compile(r',\s*(\}|\])')
-    MISSING_COMMA_PATTERN = re.compile(r'(\}|\])\s*(\{|\[)')
-    UNQUOTED_PROPERTY_PATTERN = re.compile(r'([{,])\s*([a-zA-Z_][a-zA-Z0-9_]*)\s*:')
+
+    __slots__ = ()
 
     def extract(self, text: str) -> Dict[str, Any]:
         """Extract and parse JSON tool calls from the input text with enhanced error recovery.
@@ -38,114 +76,162 @@ class JSONToolCallParser(BaseToolCallParser):
             - Error format: `{"error": "error message"}`
         """
         try:
-            # Try to find JSON-like content
-            json_strings = self.find_json_content(text)
+            max_tool_calls = self.config.get("max_tool_calls")
             valid_calls = []
 
-            for json_str in json_strings:
+            # Candidates are found lazily, so scanning stops once enough calls are parsed
+            for start, end in self.iter_json_spans(text):
+                if max_tool_calls is not None and len(valid_calls) >= max_tool_calls:
+                    break
+                json_str = text[start:end]
                 try:
-                    # First attempt: Standard parsing with json5
-                    parsed = json5.loads(json_str)
-                    parsed = self.parse_nested_json(parsed)
+                    parsed = self.parse_json(json_str)
+                    parsed = self.parse_nested_tool_calls(parsed)
 
                     if isinstance(parsed, dict):
                         valid_calls.append(parsed)
                     elif isinstance(parsed, list):
                         valid_calls.extend(parsed)
                 except Exception:
-                    # Second attempt: Apply preprocessing to fix common issues
-                    try:
-                        fixed_json = self.preprocess_json(json_str)
-                        parsed = json5.loads(fixed_json)
-                        parsed = self.parse_nested_json(parsed)
-
-                        if isinstance(parsed, dict):
-                            valid_calls.append(parsed)
-                        elif isinstance(parsed, list):
-                            valid_calls.extend(parsed)
-                    except Exception:
-                        # If all else fails, try a more aggressive approach for lists
-                        if json_str.startswith('[') and json_str.endswith(']'):
-                            items = self.split_json_list_items(json_str)
-                            for item in items:
-                                try:
-                                    parsed_item = json5.loads(item)
-                                    parsed_item = self.parse_nested_json(parsed_item)
-                                    valid_calls.append(parsed_item)
-                                except Exception:
-                                    continue
-
+                    # If all else fails, try a more aggressive approach for lists
+                    if json_str.startswith('[') and json_str.endswith(']'):
+                        items = self.split_json_list_items(json_str)
+                        for item in items:
+                            try:
+                                parsed_item = self.parse_json(item)
+                                parsed_item = self.parse_nested_tool_calls(parsed_item)
+                                valid_calls.append(parsed_item)
+                            except Exception:
+                                continue
+
+            if max_tool_calls is not None:
+                del valid_calls[max_tool_calls:]
             return {"tool_calls": valid_calls} if valid_calls else {"error": "No valid tool calls found"}
         except Exception as e:
             return {"error": f"Unexpected error: {str(e)}"}
 
-    @staticmethod
-    def find_json_content(text: str) -> List[str]:
+    @classmethod
+    def find_json_content(cls, text: str) -> List[str]:
         """Extract potential JSON content from raw text using balanced delimiter matching.
 
-        This method scans the text character by character to identify and extract
-        valid JSON objects or arrays, handling nested structures correctly.
-
         Args:
             text (str): The raw text to search for JSON content.
 
         Returns:
             List[str]: A list of extracted JSON string segments.
         """
-        results = []
+        return [text[start:end] for start, end in cls.iter_json_spans(text)]
+
+    @staticmethod
+    def iter_json_spans(text: str) -> Iterator[Tuple[int, int]]:
+        """Yield the bounds of potential JSON objects or arrays in raw text as they are found.
+
+        This method jumps between delimiter characters (braces, brackets, quotes and
+        backslashes) with a precompiled regex, so the surrounding prose is skipped by
+        the regex engine instead of being stepped through one character at a time.
+        Nested structures and delimiters inside string literals are handled correctly.
+
+        ASCII text, the usual case for tool calls, is scanned as bytes so each delimiter
+        is compared as an int; offsets are the same as in `text`. Other text is scanned
+        as str, since its UTF-8 byte offsets would not match.
+
+        Args:
+            text (str): The raw text to search for JSON content.
+
+        Yields:
+            Tuple[int, int]: `(start, end)` slice bounds of each balanced segment.
+        """
+        if text.isascii():
+            data = text.encode('ascii')
+            delimiters, backslash, quote, openers = _DELIM_BYTES_RE, ord('\\'), ord('"'), b'{['
+        else:
+            data = text
+            delimiters, backslash, quote, openers = _DELIM_RE, '\\', '"', '{['
+
         start = None
         depth = 0
         in_string = False
-        escape_next = False
+        # Position of the character escaped by the most recent backslash
+        escaped_pos = -1
+
+        for match in delimiters.finditer(data):
+            i = match.start()
+            char = data[i]
+            escaped = i == escaped_pos
 
-        for i, char in enumerate(text):
             # Handle string literals correctly
-            if char == '\\' and not escape_next:
-                escape_next = True
+            if char == backslash:
+                if not escaped:
+                    escaped_pos = i + 1
                 continue
 
-            if char == '"' and not escape_next:
-                in_string = not in_string
-
-            escape_next = False
+            if char == quote:
+                if not escaped:
+                    in_string = not in_string
+                continue
 
             # Only process delimiters when not inside a string
             if not in_string:
-                if char in '{[' and depth == 0:
-                    start = i
+                if char in openers:
+                    if depth == 0:
+                        start = i
                     depth += 1
-                elif char in '{[':
-                    depth += 1
-                elif char in '}]':
+                else:
                     depth -= 1
                     if depth == 0 and start is not None:
-                        results.append(text[start:i + 1])
+                        yield start, i + 1
                         start = None
 
-        return results
+    def parse_json(self, json_str: str) -> Any:
+        """Parse a JSON candidate, repairing common LLM syntax errors if needed.
 
-    def preprocess_json(self, json_str: str) -> str:
-        """Preprocess JSON string to fix common LLM-generated syntax errors.
+        Strict JSON is tried first with the C-accelerated stdlib decoder, then again
+        after `preprocess_json`. json5 (pure Python and much slower) only runs for
+        text that is still invalid, e.g. because it uses single quotes or comments.
 
         Args:
             json_str (str): The potentially malformed JSON string.
 
         Returns:
-            str: A corrected JSON string.
+            Any: The parsed value.
+
+        Raises:
+            ValueError: If the text cannot be parsed by any of the stages.
         """
-        # Replace semicolons with commas between objects/arrays
-        json_str = self.SEMICOLON_PATTERN.sub(r'\1,\2', json_str)
+        try:
+            return json.loads(json_str)
+        except ValueError:
+            pass
+
+        # Text without any of the repaired error patterns would only fail the same way again
+        fixed_json = self.preprocess_json(json_str)
+        repaired = fixed_json != json_str
+        if repaired:
+            try:
+                return json.loads(fixed_json)
+            except ValueError:
+                pass
+
+        try:
+            return json5.loads(json_str)
+        except ValueError:
+            if not repaired:
+                raise
+            return json5.loads(fixed_json)
 
-        # Fix trailing commas
-        json_str = self.TRAILING_COMMA_PATTERN.sub(r'\1', json_str)
+    def preprocess_json(self, json_str: str) -> str:
+        """Preprocess JSON string to fix common LLM-generated syntax errors.
 
-        # Fix missing commas between objects/arrays
-        json_str = self.MISSING_COMMA_PATTERN.sub(r'\1,\2', json_str)
+        Fixes semicolons and missing commas between objects/arrays, trailing commas
+        and unquoted property names, all in one regex pass.
 
-        # Fix unquoted property names
-        json_str = self.UNQUOTED_PROPERTY_PATTERN.sub(r'\1"\2":', json_str)
+        Args:
+            json_str (str): The potentially malformed JSON string.
 
-        return json_str
+        Returns:
+            str: A corrected JSON string.
+        """
+        return _REPAIR_RE.sub(_repair_match, json_str)
 
     def split_json_list_items(self, json_list: str) -> List[str]:
         """Split a JSON array string into individual item strings for separate parsing.
@@ -196,8 +282,35 @@ class JSONToolCallParser(BaseToolCallParser):
 
         return items
 
+    def parse_nested_tool_calls(self, value: Any) -> Any:
+        """Parse stringified JSON within a parsed tool call or list of tool calls.
+
+        A dict with only `name` and `arguments` keys is a plain tool call, so only
+        its arguments are walked; anything else goes through `parse_nested_json`.
+
+        Args:
+            value (Any): A parsed tool call, list of tool calls or other value.
+
+        Returns:
+            Any: The processed value.
+        """
+        if isinstance(value, list):
+            for index, item in enumerate(value):
+                value[index] = self.parse_nested_tool_calls(item)
+            return value
+        if isinstance(value, dict) and value.keys() <= _TOOL_CALL_KEYS:
+            if "arguments" in value:
+                value["arguments"] = self.parse_nested_json(value["arguments"])
+            return value
+        return self.parse_nested_json(value)
+
     def parse_nested_json(self, value: Any) -> Any:
-        """Recursively parses stringified JSON within a JSON structure.
+        """Parses stringified JSON within a JSON structure, at any depth.
+
+        The structure is walked iteratively and updated in place: only strings that
+        parse as JSON are replaced, and containers without such strings are returned
+        as they are rather than rebuilt. Values produced by the JSON parsers are never
+        shared, so this is only visible to callers passing in their own objects.
 
         Args:
             value (Any): The input value to check and potentially parse.
@@ -206,21 +319,44 @@ class JSONToolCallParser(BaseToolCallParser):
             Any: The processed value, either as a parsed JSON object or as its original type.
         """
         if isinstance(value, str):
-            trimmed = value.strip()
-            if trimmed and trimmed[0] in ['{', '[']:
-                try:
-                    # Try to fix common issues and then parse
-                    fixed_str = self.preprocess_json(trimmed)
-                    parsed = json5.loads(fixed_str)
-                    return self.parse_nested_json(parsed)
-                except Exception:
-                    # If that fails, return as is
-                    return value
-            else:
-                return value
-        elif isinstance(value, dict):
-            return {k: self.parse_nested_json(v) for k, v in value.items()}
-        elif isinstance(value, list):
-            return [self.parse_nested_json(item) for item in value]
-        else:
+            value = self._parse_json_string(value)
+        if not isinstance(value, (dict, list)):
+            return value
+
+        stack = [value]
+        while stack:
+            container = stack.pop()
+            items = container.items() if isinstance(container, dict) else enumerate(container)
+            for key, item in items:
+                if isinstance(item, str):
+                    parsed = self._parse_json_string(item)
+                    if parsed is not item:
+                        # Replacing a value never resizes the container being iterated
+                        container[key] = parsed
+                        if isinstance(parsed, (dict, list)):
+                            stack.append(parsed)
+                elif isinstance(item, (dict, list)):
+                    stack.append(item)
+
+        return value
+
+    def _parse_json_string(self, value: str) -> Any:
+        """Parse a string value that looks like a JSON object or array.
+
+        Args:
+            value (str): The string to check and potentially parse.
+
+        Returns:
+            Any: The parsed value, or `value` itself if it does not start with
+                `{` or `[` or cannot be parsed.
+        """
+        # lstrip() returns the string itself when there is no leading whitespace, so
+        # plain values are rejected without a copy; the tail is only trimmed for candidates
+        trimmed = value.lstrip()
+        if trimmed[:1] not in ('{', '['):
+            return value
+        try:
+            return self.parse_json(trimmed.rstrip())
+        except Exception:
+            # If that fails, return as is
             return value
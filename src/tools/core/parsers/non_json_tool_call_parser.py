@@ -2,7 +2,7 @@
 
 import re
 import json
-from typing import Dict, Any
+from typing import Dict, Any, List
 from src.tools.core.parsers.base_tool_call_parser import BaseToolCallParser
 
 
@@ -25,6 +25,16 @@ class NonJSONToolCallParser(BaseToolCallParser):
         result = parser.parse('<function=my_tool>{"arg1": "value"}</function>')
         ```
     """
+
+    __slots__ = ("function_call_pattern",)
+
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        # Compiled once here rather than looked up in the config and re's pattern cache on every call
+        self.function_call_pattern = re.compile(
+            config.get("formats").get("non_json_format").get("function_call_pattern")
+        )
+
     def extract(self, text: str) -> Dict[str, Any]:
         """Extract non-JSON tool calls using regex patterns.
 
@@ -41,20 +51,18 @@ class NonJSONToolCallParser(BaseToolCallParser):
                 - Error format: {"error": "error message"}
                 - No tool calls: {"content": "original text"}
         """
-        pattern = self.config.get("formats").get("non_json_format").get("function_call_pattern")
-        matches = re.findall(pattern, text)
-
-        if not matches:
-            return {"content": text}
-
-        tool_calls = []
-        for match in matches:
+        tool_calls: List[Dict[str, Any]] = []
+        for match in self.function_call_pattern.finditer(text):
+            name, arguments = match.group(1, 2)
             try:
                 tool_calls.append({
-                    "name": match[0],
-                    "arguments": json.loads(match[1])  # Parse arguments as JSON
+                    "name": name,
+                    "arguments": json.loads(arguments)  # Parse arguments as JSON
                 })
             except json.JSONDecodeError:
-                return {"error": f"Failed to parse arguments for function: {match[0]}"}
+                return {"error": f"Failed to parse arguments for function: {name}"}
+
+        if not tool_calls:
+            return {"content": text}
 
         return {"tool_calls": tool_calls}
@@ -214,6 +214,24 @@ class ToolRegistry:
         await self._register_tools(all_infos)
         self._log_registration_summary()
 
+    async def close(self):
+        """
+        Release resources held by registered tools, such as pooled HTTP sessions.
+        Calls each tool's `close()` if it has one; a failure is logged and does not stop the rest.
+        """
+        async with self._lock:
+            tools = [*self.tools.values(), *self.hidden_tools.values()]
+        for tool in tools:
+            close = getattr(tool, "close", None)
+            if close is None:
+                continue
+            try:
+                result = close()
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                self.logger.error(f"Error closing tool '{tool.name}': {e}", exc_info=True)
+
     async def get_tool(self, name: str) -> Optional[BaseTool]:
         """Retrieve a registered tool by name."""
         async with self._lock:
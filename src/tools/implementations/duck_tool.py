@@ -133,8 +133,6 @@ class DuckDuckGoSearchTool(BaseRESTTool):
             No exceptions are raised; errors are caught and returned
             as error messages in the result string.
         """
-        import aiohttp
-
         url = "https://html.duckduckgo.com/html/"
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/96.0.4664.110 Safari/537.36",
@@ -152,60 +150,60 @@ class DuckDuckGoSearchTool(BaseRESTTool):
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers, data=data) as response:
-                    if response.status != 200:
-                        return f"Error: DuckDuckGo returned status code {response.status}"
-
-                    html_content = await response.text()
-
-                    # Parse the DuckDuckGo search results
-                    results = []
-                    soup = BeautifulSoup(html_content, "html.parser")
-
-                    for result in soup.select(".result"):
-                        try:
-                            title_element = result.select_one(".result__a")
-                            snippet_element = result.select_one(".result__snippet")
-
-                            if not title_element:
-                                continue
-
-                            title = title_element.get_text().strip()
-                            url = title_element.get("href", "")
-
-                            # Extract the actual URL from DuckDuckGo's redirect URL
-                            if url.startswith("/"):
-                                url_match = re.search(r'uddg=([^&]+)', url)
-                                if url_match:
-                                    url = unquote(url_match.group(1))
-
-                            snippet = snippet_element.get_text().strip() if snippet_element else "No description available."
-
-                            results.append({
-                                "title": title,
-                                "url": url,
-                                "snippet": snippet
-                            })
-
-                            if len(results) >= 5:
-                                break
-                        except Exception as e:
-                            self.logger.error(f"Error parsing result: {str(e)}")
-                            continue
+            session = await self._get_session()
+            async with session.post(url, headers=headers, data=data) as response:
+                if response.status != 200:
+                    return f"Error: DuckDuckGo returned status code {response.status}"
+
+                html_content = await response.text()
 
-                    if not results:
-                        return "No search results found on DuckDuckGo."
+                # Parse the DuckDuckGo search results
+                results = []
+                soup = BeautifulSoup(html_content, "html.parser")
 
-                    # Format the results
-                    formatted_output = "## DuckDuckGo Search Results\n\n"
-                    for i, result in enumerate(results, 1):
-                        formatted_output += f"### {i}. {result['title']}\n"
-                        formatted_output += f"{result['snippet']}\n"
-                        formatted_output += f"[Link]({result['url']})\n\n"
+                for result in soup.select(".result"):
+                    try:
+                        title_element = result.select_one(".result__a")
+                        snippet_element = result.select_one(".result__snippet")
+
+                        if not title_element:
+                            continue
 
-                    formatted_output += "These results are from DuckDuckGo and may not reflect the latest information."
-                    return formatted_output
+                        title = title_element.get_text().strip()
+                        url = title_element.get("href", "")
+
+                        # Extract the actual URL from DuckDuckGo's redirect URL
+                        if url.startswith("/"):
+                            url_match = re.search(r'uddg=([^&]+)', url)
+                            if url_match:
+                                url = unquote(url_match.group(1))
+
+                        snippet = snippet_element.get_text().strip() if snippet_element else "No description available."
+
+                        results.append({
+                            "title": title,
+                            "url": url,
+                            "snippet": snippet
+                        })
+
+                        if len(results) >= 5:
+                            break
+                    except Exception as e:
+                        self.logger.error(f"Error parsing result: {str(e)}")
+                        continue
+
+                if not results:
+                    return "No search results found on DuckDuckGo."
+
+                # Format the results
+                formatted_output = "## DuckDuckGo Search Results\n\n"
+                for i, result in enumerate(results, 1):
+                    formatted_output += f"### {i}. {result['title']}\n"
+                    formatted_output += f"{result['snippet']}\n"
+                    formatted_output += f"[Link]({result['url']})\n\n"
+
+                formatted_output += "These results are from DuckDuckGo and may not reflect the latest information."
+                return formatted_output
         except Exception as e:
             self.logger.error(f"DuckDuckGo search error: {str(e)}")
             return f"Error searching DuckDuckGo: {str(e)}"
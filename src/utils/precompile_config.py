@@ -0,0 +1,101 @@
+# src/utils/precompile_config.py
+
+"""Precompiles YAML config files into plain Python modules.
+
+Parsing YAML at worker startup is slow compared to executing a module that holds
+the already-parsed dictionary as a literal. This module writes such a module next
+to the YAML file (e.g. while building the container image) and loads it back.
+
+The generated module records a SHA-256 digest of the YAML it was built from and is
+ignored if the YAML has changed since, so a stale module can never be used.
+
+Example:
+    python -m src.utils.precompile_config
+    python -m src.utils.precompile_config path/to/config.yaml
+"""
+
+import sys
+import pprint
+import hashlib
+import logging
+import importlib.util
+from pathlib import Path
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONFIG_PATHS = ("src/configs/prompt_builders.yaml",)
+GENERATED_SUFFIX = "_generated.py"
+
+
+def generated_path_for(yaml_path: str) -> Path:
+    """Returns the path of the generated module for a YAML config file.
+
+    Args:
+        yaml_path: Path to the YAML config file.
+
+    Returns:
+        The YAML path with its suffix replaced by `_generated.py`.
+    """
+    path = Path(yaml_path)
+    return path.with_name(path.stem + GENERATED_SUFFIX)
+
+
+def _file_digest(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def precompile_config(yaml_path: str) -> Path:
+    """Parses a YAML config file and writes it out as a Python module.
+
+    Args:
+        yaml_path: Path to the YAML config file.
+
+    Returns:
+        The path the generated module was written to.
+    """
+    # Imported here so loading a precompiled config never pulls in PyYAML
+    import yaml
+    from src.utils.yaml_loader import YamlSafeLoader
+
+    with open(yaml_path, "r") as f:
+        config = yaml.load(f, Loader=YamlSafeLoader)
+    output = generated_path_for(yaml_path)
+    output.write_text(
+        f"# Generated from {yaml_path} by `python -m src.utils.precompile_config`; do not edit.\n\n"
+        f"SOURCE_SHA256 = {_file_digest(yaml_path)!r}\n\n"
+        f"CONFIG = {pprint.pformat(config, sort_dicts=False)}\n"
+    )
+    return output
+
+
+def load_precompiled_config(yaml_path: str) -> Optional[Dict]:
+    """Loads the precompiled module for a YAML config file if it is up to date.
+
+    Args:
+        yaml_path: Path to the YAML config file.
+
+    Returns:
+        The generated `CONFIG` dictionary, or None if no generated module exists,
+        it cannot be loaded, or it was built from a different version of the YAML file.
+    """
+    module_path = generated_path_for(yaml_path)
+    if not module_path.is_file():
+        return None
+    try:
+        spec = importlib.util.spec_from_file_location(module_path.stem, module_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        if module.SOURCE_SHA256 != _file_digest(yaml_path):
+            logger.info("Precompiled config at %s is stale; parsing %s", module_path, yaml_path)
+            return None
+        return module.CONFIG
+    except (OSError, SyntaxError, AttributeError) as e:
+        logger.warning("Ignoring unreadable precompiled config at %s: %s", module_path, str(e))
+        return None
+
+
+if __name__ == "__main__":
+    for source in sys.argv[1:] or DEFAULT_CONFIG_PATHS:
+        print(f"Precompiled {source} -> {precompile_config(source)}")
@@ -0,0 +1,50 @@
+# src/utils/settings.py
+
+import os
+from functools import lru_cache
+from dataclasses import dataclass
+from typing import Optional
+
+from dotenv import load_dotenv
+
+
+@dataclass(frozen=True)
+class AppSettings:
+    """Application settings read from environment variables.
+
+    Values are read once at startup; use `get_settings()` instead of calling
+    `os.getenv` so request-time code never touches the environment.
+
+    Attributes:
+        log_level (str): Logging level name (from `LOG_LEVEL`, default 'INFO').
+        flexo_api_key (Optional[str]): API key clients must send (from `FLEXO_API_KEY`).
+        enable_api_key (bool): Whether API key authentication is enforced
+            (from `ENABLE_API_KEY`, enabled unless set to 'false').
+    """
+    log_level: str = "INFO"
+    flexo_api_key: Optional[str] = None
+    enable_api_key: bool = True
+
+    @classmethod
+    def from_env(cls) -> "AppSettings":
+        """Build settings from the current process environment.
+
+        Returns:
+            AppSettings: Settings populated from environment variables.
+        """
+        return cls(
+            log_level=os.getenv("LOG_LEVEL", "INFO").upper(),
+            flexo_api_key=os.getenv("FLEXO_API_KEY"),
+            enable_api_key=os.getenv("ENABLE_API_KEY", "true").lower() != "false",
+        )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> AppSettings:
+    """Return the process-wide settings, loading `.env` on first use.
+
+    Returns:
+        AppSettings: The cached application settings.
+    """
+    load_dotenv()
+    return AppSettings.from_env()
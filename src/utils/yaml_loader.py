@@ -0,0 +1,22 @@
+# src/utils/yaml_loader.py
+
+"""Shared PyYAML loader selection.
+
+Import `YamlSafeLoader` from here and parse with `yaml.load(f, Loader=YamlSafeLoader)`
+instead of `yaml.safe_load(f)`. It is the libyaml-backed `CSafeLoader`, which parses
+several times faster, or the pure-Python `SafeLoader` if PyYAML was built without
+libyaml. Both accept the same (safe) subset of YAML.
+"""
+
+import yaml
+
+# Prefer the libyaml-backed loader; fall back to the pure-Python one if PyYAML was built without it
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
+
+
+def libyaml_available() -> bool:
+    """Returns True if YAML files are parsed with the libyaml C loader."""
+    return YamlSafeLoader is not yaml.SafeLoader
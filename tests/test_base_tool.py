@@ -0,0 +1,40 @@
+# tests/test_base_tool.py
+
+from src.tools.core.base_tool import BaseTool
+
+
+class _EchoTool(BaseTool):
+    name = "echo"
+
+    def __init__(self):
+        super().__init__()
+        self.description = "Echo the input"
+        self.parameters = {
+            "type": "object",
+            "properties": {"text": {"type": "string"}},
+            "required": ["text"],
+        }
+
+    async def execute(self, context=None, **kwargs):
+        pass
+
+    def parse_output(self, output: str):
+        return output
+
+
+def test_get_definition_is_reused_until_attributes_change():
+    """Test that the cached definition is rebuilt after attributes or parameters change"""
+    tool = _EchoTool()
+    definition = tool.get_definition()
+    assert tool.get_definition() is definition
+
+    tool.parameters["properties"]["count"] = {"type": "integer"}
+    changed = tool.get_definition()
+    assert changed is not definition
+    assert set(changed.function.parameters.properties) == {"text", "count"}
+
+    tool.parameters = {"type": "object", "properties": {}, "required": []}
+    assert tool.get_definition().function.parameters.properties == {}
+
+    tool.description = "Say it again"
+    assert tool.get_definition().function.description == "Say it again"
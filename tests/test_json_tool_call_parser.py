@@ -0,0 +1,90 @@
+# tests/test_json_tool_call_parser.py
+
+import pytest
+from src.tools.core.parsers import JSONToolCallParser, NonJSONToolCallParser
+
+
+@pytest.fixture
+def parser():
+    return JSONToolCallParser({})
+
+
+def test_find_json_content():
+    """Test balanced JSON segment extraction"""
+    text = 'Calling {"a": {"b": [1, 2]}} and then [3, {"c": 4}] now'
+    assert JSONToolCallParser.find_json_content(text) == ['{"a": {"b": [1, 2]}}', '[3, {"c": 4}]']
+
+    # Delimiters inside strings and escaped quotes don't affect nesting
+    text = r'x {"q": "a } \" ] {"} y'
+    assert JSONToolCallParser.find_json_content(text) == [r'{"q": "a } \" ] {"}']
+
+    # Non-ASCII text is sliced on the same offsets
+    text = 'café {"name": "résumé"} ok'
+    assert JSONToolCallParser.find_json_content(text) == ['{"name": "résumé"}']
+
+    assert JSONToolCallParser.find_json_content("no json here") == []
+    assert list(JSONToolCallParser.iter_json_spans('ab{}')) == [(2, 4)]
+
+
+def test_extract_strict_json(parser):
+    """Test extraction of valid tool calls"""
+    result = parser.extract('Sure. [{"name": "search", "arguments": {"query": "weather", "limit": 5}}]')
+    assert result == {"tool_calls": [{"name": "search", "arguments": {"query": "weather", "limit": 5}}]}
+
+    assert parser.extract("nothing to see") == {"error": "No valid tool calls found"}
+
+
+def test_extract_repairs_common_errors(parser):
+    """Test repair of unquoted keys, trailing commas, semicolons and missing commas"""
+    assert parser.extract('{name: "f", arguments: {x: 1,}}') == {
+        "tool_calls": [{"name": "f", "arguments": {"x": 1}}]
+    }
+    assert parser.extract('[{"name": "a"}; {"name": "b"}]') == {"tool_calls": [{"name": "a"}, {"name": "b"}]}
+    assert parser.extract('[{"name": "a"} {"name": "b"}]') == {"tool_calls": [{"name": "a"}, {"name": "b"}]}
+    assert parser.extract("{name: 'f', arguments: {}}") == {"tool_calls": [{"name": "f", "arguments": {}}]}
+
+
+def test_repairs_leave_string_values_intact(parser):
+    """Test that repairs never change the contents of string literals"""
+    assert parser.extract('{name: "f", arguments: {q: "a,]"}}') == {
+        "tool_calls": [{"name": "f", "arguments": {"q": "a,]"}}]
+    }
+    assert parser.extract('{name: "f", arguments: {code: "x = {}{}"}}') == {
+        "tool_calls": [{"name": "f", "arguments": {"code": "x = {}{}"}}]
+    }
+    assert parser.extract('{name: "f", arguments: {q: "k: v, w: ;[]"}}') == {
+        "tool_calls": [{"name": "f", "arguments": {"q": "k: v, w: ;[]"}}]
+    }
+    assert parser.extract("{name: 'f', arguments: {q: 'b, c: d'}}") == {
+        "tool_calls": [{"name": "f", "arguments": {"q": "b, c: d"}}]
+    }
+    assert parser.preprocess_json('{"s": "a\\"},{b"}') == '{"s": "a\\"},{b"}'
+
+
+def test_nested_json_strings(parser):
+    """Test parsing of stringified JSON inside tool call arguments"""
+    result = parser.extract('{"name": "f", "arguments": "{\\"x\\": \\"[1, 2]\\"}"}')
+    assert result == {"tool_calls": [{"name": "f", "arguments": {"x": [1, 2]}}]}
+
+    # Plain strings and unparseable candidates are left as they are
+    assert parser.parse_nested_json({"a": " plain ", "b": "[oops"}) == {"a": " plain ", "b": "[oops"}
+    assert parser.parse_nested_json(" [1] ") == [1]
+
+
+def test_max_tool_calls():
+    """Test that scanning stops at the configured number of tool calls"""
+    text = '[{"name": "a"}, {"name": "b"}] {"name": "c"}'
+    assert JSONToolCallParser({}).extract(text)["tool_calls"] == [{"name": "a"}, {"name": "b"}, {"name": "c"}]
+    assert JSONToolCallParser({"max_tool_calls": 1}).extract(text)["tool_calls"] == [{"name": "a"}]
+
+
+def test_non_json_parser():
+    """Test extraction of <function=...> style tool calls"""
+    parser = NonJSONToolCallParser({
+        "formats": {"non_json_format": {"function_call_pattern": r'<function=(.*?)>({.*?})</function>'}}
+    })
+    assert parser.extract('<function=a>{"q": 1}</function> <function=b>{}</function>') == {
+        "tool_calls": [{"name": "a", "arguments": {"q": 1}}, {"name": "b", "arguments": {}}]
+    }
+    assert parser.extract("plain text") == {"content": "plain text"}
+    assert parser.extract("<function=a>{bad}</function>") == {"error": "Failed to parse arguments for function: a"}
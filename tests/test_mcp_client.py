@@ -0,0 +1,43 @@
+# tests/test_mcp_client.py
+
+from types import SimpleNamespace
+
+import anyio
+import pytest
+
+from src.mcp.client import FlexoMCPClient
+
+
+def _notification(method, params):
+    return SimpleNamespace(root=SimpleNamespace(method=method, params=params))
+
+
+@pytest.mark.asyncio
+async def test_notifications_are_handled_in_order_per_method():
+    """Test that each method's notifications are handled in arrival order and list_changed ones coalesce"""
+    client = FlexoMCPClient({})
+    client._session = object()
+    client._notification_limiter = anyio.Semaphore(16)
+    handled = []
+
+    async def on_log(notification):
+        # The first notification is the slowest, so running them concurrently would reorder them
+        await anyio.sleep(0.02 if notification.root.params == 0 else 0)
+        handled.append(("log", notification.root.params))
+
+    async def on_tools_changed(notification):
+        handled.append(("tools", notification.root.params))
+
+    client.register_notification_handler("notifications/message", on_log)
+    client.register_notification_handler("notifications/tools/list_changed", on_tools_changed)
+
+    async with anyio.create_task_group() as task_group:
+        client._task_group = task_group
+        for i in range(3):
+            await client._on_server_notification(_notification("notifications/message", i))
+            await client._on_server_notification(_notification("notifications/tools/list_changed", i))
+        for queue in client._notification_queues.values():
+            queue.close()
+
+    assert [params for kind, params in handled if kind == "log"] == [0, 1, 2]
+    assert [params for kind, params in handled if kind == "tools"] == [2]
@@ -0,0 +1,86 @@
+# tests/test_mistral_prompt_builder.py
+
+import os
+
+import mistral_common
+import pytest
+from mistral_common.exceptions import MistralCommonException
+from mistral_common.protocol.instruct.request import ChatCompletionRequest
+from mistral_common.tokens.tokenizers.mistral import MistralTokenizer
+
+from src.data_models.chat_completions import (
+    AssistantMessage, FunctionDetail, SystemMessage, ToolCall, ToolMessage, UserMessage
+)
+from src.data_models.tools import Function, FunctionParameters, Tool
+from src.prompt_builders.prompt_models import PromptPayload
+from src.prompt_builders.watsonx.mistral import mistral_prompt_builder
+
+
+@pytest.fixture
+def tokenizer(monkeypatch):
+    # The tokenizer bundled with mistral_common avoids downloading one for the model
+    path = os.path.join(os.path.dirname(mistral_common.__file__), "data", "tekken_240911.json")
+    tokenizer = MistralTokenizer.from_file(path)
+    monkeypatch.setattr(mistral_prompt_builder, "_get_mistral_tokenizer", lambda model_name: tokenizer)
+    return tokenizer
+
+
+def _weather_tool(city_schema=None):
+    return Tool(type="function", function=Function(
+        name="weather",
+        description="Get the weather for a city",
+        parameters=FunctionParameters(
+            type="object",
+            properties={"city": city_schema or {"type": "string"}},
+            required=["city"],
+            additionalProperties=False,
+        ),
+    ))
+
+
+_CONVERSATION = [
+    SystemMessage(content="You are helpful."),
+    UserMessage(content="Weather in Paris?"),
+    AssistantMessage(tool_calls=[ToolCall(
+        id="abc123def", function=FunctionDetail(name="weather", arguments='{"city": "Paris"}')
+    )]),
+    ToolMessage(content="Sunny", tool_call_id="abc123def"),
+    AssistantMessage(content="It is sunny in Paris."),
+    UserMessage(content="And in Rome?"),
+]
+
+
+@pytest.mark.parametrize("use_encode_chat_completion", [False, True])
+@pytest.mark.asyncio
+async def test_build_text_matches_encode_chat_completion(tokenizer, use_encode_chat_completion):
+    """Test that both encoding paths render the same prompt as encode_chat_completion"""
+    builder = mistral_prompt_builder.WatsonXMistralPromptBuilder(
+        use_encode_chat_completion=use_encode_chat_completion
+    )
+    tools = [_weather_tool()]
+    expected = tokenizer.encode_chat_completion(ChatCompletionRequest(
+        tools=list(mistral_prompt_builder._mistral_tools(builder._tool_entries(tools))),
+        messages=builder._process_conversation_history(_CONVERSATION),
+        model=builder.model_name,
+    ))
+
+    for _ in range(2):
+        mistral_prompt_builder._prompt_text_cache.clear()
+        output = await builder.build_text(PromptPayload(conversation_history=_CONVERSATION, tool_definitions=tools))
+        assert output.text_prompt == expected.text
+
+
+def test_encode_messages_validates(tokenizer):
+    """Test that invalid messages and tools raise on every call"""
+    builder = mistral_prompt_builder.WatsonXMistralPromptBuilder()
+    tools = [_weather_tool({"type": 5})]
+    tool_entries = builder._tool_entries(tools)
+    mistral_tools = list(mistral_prompt_builder._mistral_tools(tool_entries))
+    messages = builder._process_conversation_history(_CONVERSATION)
+
+    for _ in range(2):
+        with pytest.raises(MistralCommonException):
+            builder._encode_messages(messages, mistral_tools, tool_entries)
+
+    with pytest.raises(MistralCommonException):
+        builder._encode_messages(messages[:4] + messages[5:], [], ())
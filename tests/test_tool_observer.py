@@ -0,0 +1,104 @@
+# tests/test_tool_observer.py
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from mcp import types
+
+from src.tools.core.observer import MCPToolObserver, ToolEventType, ToolRegistryObserver, ToolUpdateEvent
+
+
+def _tool(name, properties=None):
+    return types.Tool(name=name, inputSchema={"type": "object", "properties": properties or {}})
+
+
+@pytest.mark.asyncio
+async def test_notify_delivers_in_background():
+    """Test that notify returns before slow subscribers finish and failures are isolated"""
+    observer = ToolRegistryObserver()
+    received = []
+
+    async def slow(event):
+        await asyncio.sleep(0.05)
+        received.append(event.event_type)
+
+    async def failing(event):
+        raise RuntimeError("boom")
+
+    observer.subscribe(slow)
+    observer.subscribe(slow)
+    observer.subscribe(failing)
+    observer.subscribe(lambda event: received.append("sync"))
+
+    await observer.notify(ToolUpdateEvent(ToolEventType.ADDED, new_tool_defs=[_tool("a")]))
+    assert received == []
+
+    await observer.drain()
+    assert received == ["sync", ToolEventType.ADDED]
+    await observer.close()
+
+
+@pytest.mark.asyncio
+async def test_close_releases_drain():
+    """Test that closing the observer releases drain() callers waiting on discarded events"""
+    observer = ToolRegistryObserver()
+    blocker = asyncio.Event()
+    observer.subscribe(lambda event: blocker.wait())
+
+    await observer.notify(ToolUpdateEvent(ToolEventType.ADDED, new_tool_defs=[_tool("a")]))
+    await observer.notify(ToolUpdateEvent(ToolEventType.REMOVED, removed_tool_names=["a"]))
+    drain = asyncio.create_task(observer.drain())
+    await asyncio.sleep(0)
+    assert not drain.done()
+
+    await observer.close()
+    await asyncio.wait_for(drain, timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_queued_events_are_merged_only_when_disjoint():
+    """Test coalescing of events queued while a delivery is in progress"""
+    observer = ToolRegistryObserver()
+    received = []
+    observer.subscribe(lambda event: received.append(event))
+
+    await observer.notify(ToolUpdateEvent(ToolEventType.ADDED, new_tool_defs=[_tool("a")]))
+    await observer.notify(ToolUpdateEvent(ToolEventType.REMOVED, removed_tool_names=["b"]))
+    await observer.notify(ToolUpdateEvent(ToolEventType.REMOVED, removed_tool_names=["a"]))
+    await observer.drain()
+
+    assert [event.event_type for event in received] == [ToolEventType.LIST_CHANGED, ToolEventType.REMOVED]
+    assert received[0].removed_tool_names == ["b"]
+    assert received[1].removed_tool_names == ["a"]
+    await observer.close()
+
+
+@pytest.mark.asyncio
+async def test_mcp_observer_debounces_and_diffs():
+    """Test that a burst of list_changed notifications reloads once and diffs by name and content"""
+    tools = [_tool("a"), _tool("b"), _tool("c")]
+    calls = []
+
+    async def list_tools():
+        calls.append(1)
+        return SimpleNamespace(tools=list(tools))
+
+    notification = SimpleNamespace(session=SimpleNamespace(list_tools=list_tools))
+    mcp_observer = MCPToolObserver(debounce_seconds=0.01)
+    received = []
+    mcp_observer.observer.subscribe(lambda event: received.append(event))
+
+    await asyncio.gather(*(mcp_observer._handle_tools_list_changed(notification) for _ in range(5)))
+    assert len(calls) == 1
+
+    tools[:] = [_tool("z"), _tool("a", {"x": {"type": "string"}}), _tool("c")]
+    await mcp_observer._handle_tools_list_changed(notification)
+    await mcp_observer.drain()
+
+    assert [tool.name for tool in received[0].new_tool_defs] == ["a", "b", "c"]
+    changed = received[1]
+    assert [tool.name for tool in changed.new_tool_defs] == ["z"]
+    assert changed.removed_tool_names == ["b"]
+    assert [tool.name for tool in changed.updated_tool_defs] == ["a"]
+    await mcp_observer.close()